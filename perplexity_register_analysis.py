@@ -24,31 +24,101 @@ os.environ.setdefault("NUMEXPR_NUM_THREADS", "1")
 os.environ.setdefault("KMP_AFFINITY", "disabled")
 os.environ.setdefault("KMP_INIT_AT_FORK", "FALSE")
 
+import gc
 import json
+import math
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
 from collections import Counter, defaultdict
+from functools import lru_cache
+from pandas.api.types import union_categoricals
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+try:
+    import pyarrow  # noqa: F401  (Parquet engine for the events cache)
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Set style
 sns.set_style("whitegrid")
 plt.rcParams['figure.dpi'] = 200
 plt.rcParams['font.size'] = 10
 
 
+# Below this many types a scalar math.log2 loop beats NumPy ufunc dispatch
+SMALL_DISTRIBUTION_SIZE = 32
+
+
+def _entropy_from_counts(counts: np.ndarray) -> float:
+    """Shannon entropy (bits) of a frequency array.
+
+    Uses H = log₂N - (1/N) ∑ c log₂ c, which avoids normalizing the
+    counts into probabilities first.
+    """
+    if counts.size <= SMALL_DISTRIBUTION_SIZE:
+        N = 0.0
+        S = 0.0
+        for c in counts.tolist():
+            if c > 0:
+                N += c
+                S += c * math.log2(c)
+        return max(math.log2(N) - S / N, 0.0)
+
+    N = counts.sum()
+    c = counts[counts > 0]
+    return max(float(np.log2(N) - (c * np.log2(c)).sum() / N), 0.0)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _entropy_from_counts(counts: np.ndarray) -> float:
+        """Shannon entropy (bits) of a frequency array, in a single fused pass."""
+        N = 0.0
+        S = 0.0
+        for c in counts:
+            if c > 0:
+                N += c
+                S += c * math.log2(c)
+        return max(math.log2(N) - S / N, 0.0)
+
+
+@lru_cache(maxsize=4096)
+def _cached_metrics(counts_tuple: Tuple) -> Tuple[float, float, float]:
+    """(entropy, perplexity, normalized perplexity) for a sorted tuple of counts.
+
+    Entropy is permutation-invariant, so sorting canonicalizes the key and
+    repeated distributions (common among small event types) are free.
+    """
+    counts = np.array(counts_tuple, dtype=np.float64)
+    H = float(_entropy_from_counts(counts))
+    PP = 2.0 ** H
+    return H, PP, PP ** (1.0 / counts.size)
+
+
 class PerplexityCalculator:
     """Calculates perplexity metrics."""
 
-    def entropy(self, probabilities: List[float]) -> float:
-        """Calculate Shannon entropy: H = -∑ p(x) log₂ p(x)"""
-        entropy = 0.0
-        for p in probabilities:
-            if p > 0:
-                entropy -= p * np.log2(p)
-        return entropy
+    def entropy(self, probabilities) -> float:
+        """Calculate Shannon entropy: H = -∑ p(x) log₂ p(x)
+
+        Accepts a list or a NumPy array of probabilities.
+        """
+        p = np.asarray(probabilities, dtype=np.float64)
+        mask = p > 0
+        return float(-(p[mask] * np.log2(p[mask])).sum())
 
     def perplexity(self, probabilities: List[float]) -> float:
         """Calculate perplexity: PP = 2^H"""
@@ -62,9 +132,10 @@ class PerplexityCalculator:
             return PP ** (1.0 / N)
         return PP
 
-    def calculate_distribution_perplexity(self, counter: Counter) -> Dict[str, float]:
-        """Calculate perplexity metrics from a frequency counter."""
-        total = sum(counter.values())
+    def _metrics_from_counts(self, counts: np.ndarray) -> Dict[str, float]:
+        """Calculate perplexity metrics from an array of type frequencies."""
+        counts = np.asarray(counts)
+        total = int(counts.sum())
         if total == 0:
             return {
                 'entropy': 0.0,
@@ -74,22 +145,65 @@ class PerplexityCalculator:
                 'num_tokens': 0
             }
 
-        # Convert to probabilities
-        probabilities = [count / total for count in counter.values()]
-
-        # Calculate metrics
-        H = self.entropy(probabilities)
-        PP = 2 ** H
-        PP_norm = PP ** (1.0 / len(counter)) if len(counter) > 0 else PP
+        H, PP, PP_norm = _cached_metrics(tuple(sorted(counts.tolist())))
 
         return {
             'entropy': H,
             'perplexity': PP,
             'normalized_perplexity': PP_norm,
-            'num_types': len(counter),  # Vocabulary size
+            'num_types': int(counts.size),  # Vocabulary size
             'num_tokens': total  # Total events
         }
 
+    def calculate_distribution_perplexity(self, counter: Counter) -> Dict[str, float]:
+        """Calculate perplexity metrics from a frequency counter."""
+        counts = np.fromiter(counter.values(), dtype=np.int64, count=len(counter))
+        return self._metrics_from_counts(counts)
+
+
+# Event columns that are grouped/counted and therefore stored as categoricals
+CATEGORICAL_EVENT_COLUMNS = ('feature_id', 'canonical_value', 'headline_value', 'Direction')
+
+# Events files above this size are parsed in chunks of CSV_CHUNKSIZE rows
+STREAMING_THRESHOLD_BYTES = 512 * 1024 * 1024
+CSV_CHUNKSIZE = 100_000
+
+# Morphological rule columns used to build transformation patterns
+MORPH_RULE_COLUMNS = ('pos', 'feature', 'headline_value', 'canonical_value', 'frequency')
+
+
+def _combine_codes(*columns: pd.Series) -> np.ndarray:
+    """Fold categorical columns into one int64 key per row.
+
+    Missing values (code -1) form their own key, like the 'NULL' label.
+    """
+    keys = np.zeros(len(columns[0]), dtype=np.int64)
+    for col in columns:
+        codes = col.cat.codes.to_numpy().astype(np.int64) + 1
+        keys = keys * (len(col.cat.categories) + 1) + codes
+    return keys
+
+
+def _column_counts(col: pd.Series) -> np.ndarray:
+    """Frequencies of the non-missing values of a column, as an array.
+
+    Categorical columns are counted with bincount over their codes
+    (unobserved categories dropped); other columns with a single
+    value_counts pass.
+    """
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        codes = col.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0])
+        return counts[counts > 0]
+    return col.value_counts(dropna=True, sort=False).to_numpy()
+
+
+def _text_column(df: pd.DataFrame, col: str, default: str) -> pd.Series:
+    """A column cast to str once, with missing values (or a missing column) as default."""
+    if col not in df.columns:
+        return pd.Series(default, index=df.index)
+    return df[col].astype(object).fillna(default).astype(str)
+
 
 class RegisterPerplexityAnalyzer:
     """Analyzes register complexity using perplexity."""
@@ -124,12 +238,58 @@ class RegisterPerplexityAnalyzer:
             print(f"⚠️  Events file not found for {self.newspaper} (looked for {directional_path} and {fallback_path})")
             return pd.DataFrame()
 
-        df = pd.read_csv(path_to_use)
+        df = self._read_events_csv(path_to_use)
         if 'Direction' not in df.columns:
             df['Direction'] = 'C2H'
+        for col in CATEGORICAL_EVENT_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+
+        # Transformation keys shared by the cross-register and event-level analyses
+        df['_tk'] = _combine_codes(df['canonical_value'], df['headline_value'])
+        df['_ftk'] = _combine_codes(df['feature_id'], df['canonical_value'], df['headline_value'])
         print(f"✅ Loaded {len(df)} events for {self.newspaper} from {path_to_use}")
         return df
 
+    def _read_events_csv(self, csv_path: Path) -> pd.DataFrame:
+        """Read the analyzed columns of an events CSV.
+
+        Reuses a Parquet copy when it is newer than the CSV. Only the
+        categorical key columns are loaded ('Direction' may be absent).
+        """
+        cache_path = csv_path.with_name(f"{csv_path.stem}.perplexity.parquet")
+        if PARQUET_AVAILABLE and cache_path.exists() \
+                and cache_path.stat().st_mtime >= csv_path.stat().st_mtime:
+            return pd.read_parquet(cache_path)
+
+        read_kwargs = dict(usecols=lambda c: c in CATEGORICAL_EVENT_COLUMNS,
+                           dtype={c: 'category' for c in CATEGORICAL_EVENT_COLUMNS})
+        if csv_path.stat().st_size > STREAMING_THRESHOLD_BYTES:
+            df = self._read_events_csv_chunked(csv_path, read_kwargs)
+        else:
+            df = pd.read_csv(csv_path, **read_kwargs)
+        if PARQUET_AVAILABLE:
+            try:
+                df.to_parquet(cache_path, index=False)
+            except OSError as e:
+                print(f"⚠️  Could not write events cache {cache_path}: {e}")
+        return df
+
+    def _read_events_csv_chunked(self, csv_path: Path, read_kwargs: Dict) -> pd.DataFrame:
+        """Parse a large events CSV chunk by chunk.
+
+        Each chunk is reduced to categorical codes as it is parsed, so the
+        raw text of at most one chunk is held at a time.
+        """
+        print(f"   Streaming {csv_path.name} in chunks of {CSV_CHUNKSIZE:,} rows")
+        chunks = list(pd.read_csv(csv_path, chunksize=CSV_CHUNKSIZE, **read_kwargs))
+        if not chunks:
+            return pd.read_csv(csv_path, nrows=0, **read_kwargs)
+        return pd.DataFrame({
+            col: union_categoricals([chunk[col] for chunk in chunks])
+            for col in chunks[0].columns
+        })
+
     def load_morphological_rules(self) -> pd.DataFrame:
         """Load morphological rules."""
         morph_path = self.project_root / 'output' / self.newspaper / 'morphological_analysis' / 'morphological_rules.csv'
@@ -137,7 +297,7 @@ class RegisterPerplexityAnalyzer:
         if not morph_path.exists():
             return pd.DataFrame()
 
-        df = pd.read_csv(morph_path)
+        df = pd.read_csv(morph_path, usecols=lambda c: c in MORPH_RULE_COLUMNS)
         print(f"✅ Loaded {len(df)} morphological rules for {self.newspaper}")
         return df
 
@@ -155,51 +315,55 @@ class RegisterPerplexityAnalyzer:
 
         results = {}
 
-        # 1. Event type distribution (by Direction if available)
         if 'Direction' in self.events_df.columns:
-            for direction, group in self.events_df.groupby('Direction'):
-                event_types = Counter(group['feature_id'].values)
+            # Event type and value distributions per Direction, in one groupby pass
+            event_results = {}
+            value_results = {}
+            for direction, group in self.events_df.groupby('Direction', sort=False, observed=True):
                 key = f"event_types_{direction}"
-                results[key] = self.calculator.calculate_distribution_perplexity(event_types)
+                event_results[key] = self.calculator._metrics_from_counts(_column_counts(group['feature_id']))
+                value_results[f'canonical_values_{direction}'] = \
+                    self.calculator._metrics_from_counts(_column_counts(group['canonical_value']))
+                value_results[f'headline_values_{direction}'] = \
+                    self.calculator._metrics_from_counts(_column_counts(group['headline_value']))
+
                 print(f"Event Type Distribution ({direction}):")
-                print(f"  PP={results[key]['perplexity']:.3f}, "
-                      f"PP_norm={results[key]['normalized_perplexity']:.3f}, "
-                      f"Types={results[key]['num_types']}, "
-                      f"Tokens={results[key]['num_tokens']}")
+                print(f"  PP={event_results[key]['perplexity']:.3f}, "
+                      f"PP_norm={event_results[key]['normalized_perplexity']:.3f}, "
+                      f"Types={event_results[key]['num_types']}, "
+                      f"Tokens={event_results[key]['num_tokens']}")
+                print(f"\nCanonical Value Distribution ({direction}):")
+                print(f"  PP={value_results[f'canonical_values_{direction}']['perplexity']:.3f}, "
+                      f"PP_norm={value_results[f'canonical_values_{direction}']['normalized_perplexity']:.3f}, "
+                      f"Types={value_results[f'canonical_values_{direction}']['num_types']}")
+                print(f"\nHeadline Value Distribution ({direction}):")
+                print(f"  PP={value_results[f'headline_values_{direction}']['perplexity']:.3f}, "
+                      f"PP_norm={value_results[f'headline_values_{direction}']['normalized_perplexity']:.3f}, "
+                      f"Types={value_results[f'headline_values_{direction}']['num_types']}\n")
+
+            # Keep event types ahead of value distributions in the summary table
+            results.update(event_results)
+            results.update(value_results)
         else:
-            event_types = Counter(self.events_df['feature_id'].values)
-            results['event_types'] = self.calculator.calculate_distribution_perplexity(event_types)
+            # 1. Event type distribution
+            event_types = _column_counts(self.events_df['feature_id'])
+            results['event_types'] = self.calculator._metrics_from_counts(event_types)
             print(f"Event Type Distribution:")
             print(f"  PP={results['event_types']['perplexity']:.3f}, "
                   f"PP_norm={results['event_types']['normalized_perplexity']:.3f}, "
                   f"Types={results['event_types']['num_types']}, "
                   f"Tokens={results['event_types']['num_tokens']}")
 
-        # 2/3. Register-specific value distributions (by Direction)
-        if 'Direction' in self.events_df.columns:
-            for direction, group in self.events_df.groupby('Direction'):
-                canonical_values = Counter(group['canonical_value'].dropna().values)
-                headline_values = Counter(group['headline_value'].dropna().values)
-                results[f'canonical_values_{direction}'] = self.calculator.calculate_distribution_perplexity(canonical_values)
-                results[f'headline_values_{direction}'] = self.calculator.calculate_distribution_perplexity(headline_values)
-                print(f"\nCanonical Value Distribution ({direction}):")
-                print(f"  PP={results[f'canonical_values_{direction}']['perplexity']:.3f}, "
-                      f"PP_norm={results[f'canonical_values_{direction}']['normalized_perplexity']:.3f}, "
-                      f"Types={results[f'canonical_values_{direction}']['num_types']}")
-                print(f"\nHeadline Value Distribution ({direction}):")
-                print(f"  PP={results[f'headline_values_{direction}']['perplexity']:.3f}, "
-                      f"PP_norm={results[f'headline_values_{direction}']['normalized_perplexity']:.3f}, "
-                      f"Types={results[f'headline_values_{direction}']['num_types']}")
-        else:
-            canonical_values = Counter(self.events_df['canonical_value'].dropna().values)
-            results['canonical_values'] = self.calculator.calculate_distribution_perplexity(canonical_values)
+            # 2/3. Register-specific value distributions
+            canonical_values = _column_counts(self.events_df['canonical_value'])
+            results['canonical_values'] = self.calculator._metrics_from_counts(canonical_values)
             print(f"\nCanonical Value Distribution:")
             print(f"  PP={results['canonical_values']['perplexity']:.3f}, "
                   f"PP_norm={results['canonical_values']['normalized_perplexity']:.3f}, "
                   f"Types={results['canonical_values']['num_types']}")
 
-            headline_values = Counter(self.events_df['headline_value'].dropna().values)
-            results['headline_values'] = self.calculator.calculate_distribution_perplexity(headline_values)
+            headline_values = _column_counts(self.events_df['headline_value'])
+            results['headline_values'] = self.calculator._metrics_from_counts(headline_values)
             print(f"\nHeadline Value Distribution:")
             print(f"  PP={results['headline_values']['perplexity']:.3f}, "
                   f"PP_norm={results['headline_values']['normalized_perplexity']:.3f}, "
@@ -223,13 +387,9 @@ class RegisterPerplexityAnalyzer:
         results = {}
 
         # 1. Value transformation patterns (canonical_value → headline_value)
-        transformations = Counter()
-        for _, row in self.events_df.iterrows():
-            c_val = str(row.get('canonical_value', 'NULL'))
-            h_val = str(row.get('headline_value', 'NULL'))
-            transformations[f"{c_val}→{h_val}"] += 1
+        _, transformations = np.unique(self.events_df['_tk'].to_numpy(), return_counts=True)
 
-        results['value_transformations'] = self.calculator.calculate_distribution_perplexity(transformations)
+        results['value_transformations'] = self.calculator._metrics_from_counts(transformations)
 
         print(f"Value Transformation Patterns:")
         print(f"  PP={results['value_transformations']['perplexity']:.3f}, "
@@ -237,14 +397,9 @@ class RegisterPerplexityAnalyzer:
               f"Patterns={results['value_transformations']['num_types']}")
 
         # 2. Feature-specific transformations
-        feature_transformations = Counter()
-        for _, row in self.events_df.iterrows():
-            feature = row.get('feature_id', 'UNKNOWN')
-            c_val = str(row.get('canonical_value', 'NULL'))
-            h_val = str(row.get('headline_value', 'NULL'))
-            feature_transformations[f"{feature}:{c_val}→{h_val}"] += 1
+        _, feature_transformations = np.unique(self.events_df['_ftk'].to_numpy(), return_counts=True)
 
-        results['feature_transformations'] = self.calculator.calculate_distribution_perplexity(feature_transformations)
+        results['feature_transformations'] = self.calculator._metrics_from_counts(feature_transformations)
 
         print(f"\nFeature-Specific Transformations:")
         print(f"  PP={results['feature_transformations']['perplexity']:.3f}, "
@@ -253,14 +408,15 @@ class RegisterPerplexityAnalyzer:
 
         # 3. Morphological transformations (if available)
         if not self.morph_df.empty:
-            morph_transformations = Counter()
-            for _, row in self.morph_df.iterrows():
-                pos_val = row.get('pos', 'NA')
-                pattern = f"{row.get('feature', 'UNK')}:{row.get('headline_value', 'NULL')}→{row.get('canonical_value', 'NULL')}@{pos_val}"
-                freq = row.get('frequency', 0)
-                morph_transformations[pattern] = freq
+            patterns = (_text_column(self.morph_df, 'feature', 'UNK') + ':'
+                        + _text_column(self.morph_df, 'headline_value', 'NULL') + '→'
+                        + _text_column(self.morph_df, 'canonical_value', 'NULL') + '@'
+                        + _text_column(self.morph_df, 'pos', 'NA'))
+            freqs = self.morph_df.get('frequency', pd.Series(0, index=self.morph_df.index)).fillna(0)
+            # 'frequency' is already an aggregated count; sum it per pattern
+            morph_transformations = freqs.groupby(patterns, sort=False).sum().to_numpy()
 
-            results['morph_transformations'] = self.calculator.calculate_distribution_perplexity(morph_transformations)
+            results['morph_transformations'] = self.calculator._metrics_from_counts(morph_transformations)
 
             print(f"\nMorphological Transformations:")
             print(f"  PP={results['morph_transformations']['perplexity']:.3f}, "
@@ -278,24 +434,20 @@ class RegisterPerplexityAnalyzer:
 
         results = {}
 
-        # Group by feature_id
-        grouped = self.events_df.groupby('feature_id')
+        # Transformation patterns for every feature in one pass
+        pattern_counts = self.events_df.groupby(['feature_id', '_tk'], sort=False, observed=True).size()
+        group_counts = self.events_df['feature_id'].value_counts()
 
-        for feature_id, group in grouped:
-            # Transformation patterns for this feature
-            transformations = Counter()
-            for _, row in group.iterrows():
-                c_val = str(row.get('canonical_value', 'NULL'))
-                h_val = str(row.get('headline_value', 'NULL'))
-                transformations[f"{c_val}→{h_val}"] += 1
+        for feature_id, patterns in pattern_counts.groupby(level=0, sort=False, observed=True):
+            count = int(group_counts[feature_id])
 
-            metrics = self.calculator.calculate_distribution_perplexity(transformations)
+            metrics = self.calculator._metrics_from_counts(patterns.values)
             results[feature_id] = {
-                'count': len(group),
+                'count': count,
                 **metrics
             }
 
-            print(f"{feature_id:20s}: Count={len(group):5d}, "
+            print(f"{feature_id:20s}: Count={count:5d}, "
                   f"PP={metrics['perplexity']:7.3f}, "
                   f"PP_norm={metrics['normalized_perplexity']:6.3f}, "
                   f"Patterns={metrics['num_types']:4d}")
@@ -353,6 +505,12 @@ class RegisterPerplexityAnalyzer:
         }
 
 
+def _analyze_newspaper(newspaper: str, project_root: Path) -> Dict:
+    """Run the complete perplexity analysis for one newspaper (process-pool worker)."""
+    analyzer = RegisterPerplexityAnalyzer(newspaper, project_root)
+    return analyzer.run_complete_analysis()
+
+
 class CrossNewspaperPerplexityAnalyzer:
     """Analyzes perplexity across newspapers."""
 
@@ -370,16 +528,21 @@ class CrossNewspaperPerplexityAnalyzer:
         print("CROSS-NEWSPAPER PERPLEXITY ANALYSIS")
         print(f"{'='*80}\n")
 
-        for newspaper in self.newspapers:
-            analyzer = RegisterPerplexityAnalyzer(newspaper, self.project_root)
-            results = analyzer.run_complete_analysis()
-            self.all_results[newspaper] = results
+        # Newspapers are independent, so analyze them in parallel processes
+        max_workers = min(len(self.newspapers), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                newspaper: executor.submit(_analyze_newspaper, newspaper, self.project_root)
+                for newspaper in self.newspapers
+            }
+            for newspaper, future in futures.items():
+                self.all_results[newspaper] = future.result()
 
         # Create combined tables
-        self.create_combined_tables()
+        combined_df, event_df = self.create_combined_tables()
 
-        # Create visualizations
-        self.create_visualizations()
+        # Create visualizations from the in-memory tables
+        self.create_visualizations(combined_df, event_df)
 
         print(f"\n{'='*80}")
         print("ANALYSIS COMPLETE")
@@ -423,41 +586,68 @@ class CrossNewspaperPerplexityAnalyzer:
         event_df.to_csv(event_path, index=False)
         print(f"✅ Saved event-level analysis: {event_path}")
 
-        return combined_df
+        return combined_df, event_df
 
-    def create_visualizations(self):
+    def create_visualizations(self, combined_df: pd.DataFrame, event_df: pd.DataFrame):
         """Create comprehensive visualizations."""
         print(f"\n{'='*80}")
         print("CREATING VISUALIZATIONS")
         print(f"{'='*80}\n")
 
-        # Load data
-        combined_df = pd.read_csv(self.output_dir / 'perplexity_complete_analysis.csv')
-        event_df = pd.read_csv(self.output_dir / 'event_level_perplexity.csv')
+        # Pivot the summary table once and share it across plots
+        pivots = self.build_pivots(combined_df)
 
         # 1. Mono vs Cross-register comparison
-        self.plot_mono_vs_cross_comparison(combined_df)
+        self.plot_mono_vs_cross_comparison(pivots)
+        gc.collect()
 
         # 2. Detailed aspect comparison
-        self.plot_detailed_aspect_comparison(combined_df)
+        self.plot_detailed_aspect_comparison(pivots)
+        gc.collect()
 
         # 3. Event-level complexity
         self.plot_event_level_complexity(event_df)
+        gc.collect()
 
         # 4. Complexity heatmaps
-        self.plot_complexity_heatmaps(combined_df)
+        self.plot_complexity_heatmaps(pivots)
+        gc.collect()
 
         # 5. Normalized vs Non-normalized
         self.plot_normalization_effects(combined_df)
 
-    def plot_mono_vs_cross_comparison(self, df: pd.DataFrame):
+    def build_pivots(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Pivot the combined summary table into the matrices used by the plots."""
+        by_type = df.pivot_table(index='Analysis_Type', columns='Newspaper',
+                                 values=['Perplexity', 'Normalized_PP'], aggfunc='mean')
+        by_aspect = df.pivot_table(index='Aspect', columns='Newspaper',
+                                   values=['Entropy', 'Num_Types'], aggfunc='mean')
+        by_type_aspect = df.pivot_table(index=['Analysis_Type', 'Aspect'], columns='Newspaper',
+                                        values=['Perplexity', 'Normalized_PP'], aggfunc='mean')
+
+        analysis_types = by_type_aspect.index.get_level_values('Analysis_Type')
+        normalized = by_type_aspect['Normalized_PP']
+        return {
+            'type_perplexity': by_type['Perplexity'],
+            'type_normalized': by_type['Normalized_PP'],
+            'mono_normalized': normalized.xs('Mono-Register', level='Analysis_Type')
+                               if 'Mono-Register' in analysis_types else None,
+            'cross_normalized': normalized.xs('Cross-Register', level='Analysis_Type')
+                                if 'Cross-Register' in analysis_types else None,
+            'aspect_entropy': by_aspect['Entropy'],
+            'aspect_types': by_aspect['Num_Types'],
+            'heatmap_perplexity': by_type_aspect['Perplexity'],
+            'heatmap_normalized': normalized,
+        }
+
+    def plot_mono_vs_cross_comparison(self, pivots: Dict[str, pd.DataFrame]):
         """Plot mono-register vs cross-register comparison."""
         fig, axes = plt.subplots(1, 2, figsize=(14, 6))
         fig.suptitle('Mono-Register vs Cross-Register Complexity', fontsize=16, fontweight='bold')
 
         # Perplexity
         ax = axes[0]
-        pivot = df.pivot_table(index='Analysis_Type', columns='Newspaper', values='Perplexity', aggfunc='mean')
+        pivot = pivots['type_perplexity']
         pivot.plot(kind='bar', ax=ax, color=['#FF6B6B', '#4ECDC4', '#95E1D3'], alpha=0.8)
         ax.set_title('Average Perplexity', fontweight='bold')
         ax.set_xlabel('Analysis Type', fontweight='bold')
@@ -468,7 +658,7 @@ class CrossNewspaperPerplexityAnalyzer:
 
         # Normalized Perplexity
         ax = axes[1]
-        pivot_norm = df.pivot_table(index='Analysis_Type', columns='Newspaper', values='Normalized_PP', aggfunc='mean')
+        pivot_norm = pivots['type_normalized']
         pivot_norm.plot(kind='bar', ax=ax, color=['#FF6B6B', '#4ECDC4', '#95E1D3'], alpha=0.8)
         ax.set_title('Average Normalized Perplexity', fontweight='bold')
         ax.set_xlabel('Analysis Type', fontweight='bold')
@@ -480,19 +670,20 @@ class CrossNewspaperPerplexityAnalyzer:
         plt.tight_layout()
         path = self.output_dir / 'mono_vs_cross_register_comparison.png'
         plt.savefig(path, dpi=200, bbox_inches='tight')
-        plt.close()
+        fig.clear()
+        plt.close(fig)
+        del pivot, pivot_norm
         print(f"✅ Saved mono vs cross comparison: {path}")
 
-    def plot_detailed_aspect_comparison(self, df: pd.DataFrame):
+    def plot_detailed_aspect_comparison(self, pivots: Dict[str, pd.DataFrame]):
         """Plot detailed aspect-by-aspect comparison."""
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
         fig.suptitle('Detailed Aspect-Level Complexity Analysis', fontsize=16, fontweight='bold')
 
         # 1. Mono-register aspects
         ax = axes[0, 0]
-        mono_df = df[df['Analysis_Type'] == 'Mono-Register']
-        if not mono_df.empty:
-            pivot = mono_df.pivot(index='Aspect', columns='Newspaper', values='Normalized_PP')
+        pivot = pivots['mono_normalized']
+        if pivot is not None and not pivot.empty:
             pivot.plot(kind='barh', ax=ax, color=['#FF6B6B', '#4ECDC4', '#95E1D3'], alpha=0.8)
             ax.set_title('Mono-Register Complexity by Aspect', fontweight='bold')
             ax.set_xlabel('Normalized Perplexity', fontweight='bold')
@@ -501,9 +692,8 @@ class CrossNewspaperPerplexityAnalyzer:
 
         # 2. Cross-register aspects
         ax = axes[0, 1]
-        cross_df = df[df['Analysis_Type'] == 'Cross-Register']
-        if not cross_df.empty:
-            pivot = cross_df.pivot(index='Aspect', columns='Newspaper', values='Normalized_PP')
+        pivot = pivots['cross_normalized']
+        if pivot is not None and not pivot.empty:
             pivot.plot(kind='barh', ax=ax, color=['#FF6B6B', '#4ECDC4', '#95E1D3'], alpha=0.8)
             ax.set_title('Cross-Register Complexity by Aspect', fontweight='bold')
             ax.set_xlabel('Normalized Perplexity', fontweight='bold')
@@ -512,14 +702,14 @@ class CrossNewspaperPerplexityAnalyzer:
 
         # 3. Entropy comparison
         ax = axes[1, 0]
-        pivot_entropy = df.pivot_table(index='Aspect', columns='Newspaper', values='Entropy', aggfunc='mean')
+        pivot_entropy = pivots['aspect_entropy']
         sns.heatmap(pivot_entropy, annot=True, fmt='.2f', cmap='YlOrRd', ax=ax,
                    cbar_kws={'label': 'Entropy (bits)'})
         ax.set_title('Entropy by Aspect', fontweight='bold')
 
         # 4. Vocabulary size comparison
         ax = axes[1, 1]
-        pivot_types = df.pivot_table(index='Aspect', columns='Newspaper', values='Num_Types', aggfunc='mean')
+        pivot_types = pivots['aspect_types']
         sns.heatmap(pivot_types, annot=True, fmt='.0f', cmap='Blues', ax=ax,
                    cbar_kws={'label': 'Vocabulary Size'})
         ax.set_title('Vocabulary Size by Aspect', fontweight='bold')
@@ -527,7 +717,9 @@ class CrossNewspaperPerplexityAnalyzer:
         plt.tight_layout()
         path = self.output_dir / 'detailed_aspect_comparison.png'
         plt.savefig(path, dpi=200, bbox_inches='tight')
-        plt.close()
+        fig.clear()
+        plt.close(fig)
+        del pivot_entropy, pivot_types
         print(f"✅ Saved detailed aspect comparison: {path}")
 
     def plot_event_level_complexity(self, event_df: pd.DataFrame):
@@ -560,24 +752,25 @@ class CrossNewspaperPerplexityAnalyzer:
         plt.tight_layout()
         path = self.output_dir / 'event_level_complexity.png'
         plt.savefig(path, dpi=200, bbox_inches='tight')
-        plt.close()
+        fig.clear()
+        plt.close(fig)
         print(f"✅ Saved event-level complexity: {path}")
 
-    def plot_complexity_heatmaps(self, df: pd.DataFrame):
+    def plot_complexity_heatmaps(self, pivots: Dict[str, pd.DataFrame]):
         """Create complexity heatmaps."""
         fig, axes = plt.subplots(1, 2, figsize=(16, 6))
         fig.suptitle('Register Complexity Heatmaps', fontsize=16, fontweight='bold')
 
         # Perplexity heatmap
         ax = axes[0]
-        pivot = df.pivot_table(index=['Analysis_Type', 'Aspect'], columns='Newspaper', values='Perplexity')
+        pivot = pivots['heatmap_perplexity']
         sns.heatmap(pivot, annot=True, fmt='.1f', cmap='YlOrRd', ax=ax,
                    cbar_kws={'label': 'Perplexity'})
         ax.set_title('Perplexity Heatmap', fontweight='bold')
 
         # Normalized Perplexity heatmap
         ax = axes[1]
-        pivot_norm = df.pivot_table(index=['Analysis_Type', 'Aspect'], columns='Newspaper', values='Normalized_PP')
+        pivot_norm = pivots['heatmap_normalized']
         sns.heatmap(pivot_norm, annot=True, fmt='.3f', cmap='YlGnBu', ax=ax,
                    cbar_kws={'label': 'Normalized Perplexity'})
         ax.set_title('Normalized Perplexity Heatmap', fontweight='bold')
@@ -585,7 +778,9 @@ class CrossNewspaperPerplexityAnalyzer:
         plt.tight_layout()
         path = self.output_dir / 'complexity_heatmaps.png'
         plt.savefig(path, dpi=200, bbox_inches='tight')
-        plt.close()
+        fig.clear()
+        plt.close(fig)
+        del pivot, pivot_norm
         print(f"✅ Saved complexity heatmaps: {path}")
 
     def plot_normalization_effects(self, df: pd.DataFrame):
@@ -613,7 +808,8 @@ class CrossNewspaperPerplexityAnalyzer:
         plt.tight_layout()
         path = self.output_dir / 'normalization_effects.png'
         plt.savefig(path, dpi=200, bbox_inches='tight')
-        plt.close()
+        fig.clear()
+        plt.close(fig)
         print(f"✅ Saved normalization effects: {path}")
 
 
@@ -10,19 +10,191 @@ This module:
 
 import json
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import matplotlib
+matplotlib.use('Agg')
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
 from collections import defaultdict
+from itertools import chain, compress
+from operator import itemgetter
+from dataclasses import asdict, fields, is_dataclass
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import sys
 import os
 
 sys.path.append(os.path.dirname(__file__))
 
-from register_comparison.generation.rule_extractor import RuleExtractor
-from register_comparison.generation.morphological_rules import MorphologicalRuleExtractor
+from register_comparison.generation.rule_extractor import (
+    RuleExtractor, LexicalRule, SyntacticRule, DefaultRule
+)
+from register_comparison.generation.morphological_rules import (
+    MorphologicalRuleExtractor, MorphologicalRule
+)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow  # noqa: F401  (Parquet engine for the rule cache)
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def load_json(path: Path) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+# Rule types in the order they are combined; progressive data stores their names
+RULE_TYPES = ('lexical', 'morphological', 'syntactic', 'default')
+
+def save_table(df: pd.DataFrame, csv_path: Path):
+    """Write a table as CSV, plus a typed Parquet copy beside it when pyarrow is installed."""
+    df.to_csv(csv_path, index=False)
+    if PARQUET_AVAILABLE:
+        df.to_parquet(Path(csv_path).with_suffix('.parquet'), engine='pyarrow',
+                      compression='zstd', index=False)
+
+
+# Coverage levels (%) reported by find_optimal_rule_count
+COVERAGE_MILESTONES = (70, 80, 90)
+
+# Line plots are decimated to about this many points; metrics use every row
+MAX_PLOT_POINTS = 2000
+
+
+def decimate_for_plot(progressive_df: pd.DataFrame, max_points: int = MAX_PLOT_POINTS) -> pd.DataFrame:
+    """Every k-th row of a long progressive table (plus the last), for drawing only."""
+    if len(progressive_df) <= max_points:
+        return progressive_df
+    stride = len(progressive_df) // max_points
+    keep = np.r_[np.arange(0, len(progressive_df) - 1, stride), len(progressive_df) - 1]
+    return progressive_df.iloc[keep]
+
+# Rule dataclass per type, used to give cached rule tables a fixed schema
+RULE_CLASSES = {
+    'lexical': LexicalRule,
+    'morphological': MorphologicalRule,
+    'syntactic': SyntacticRule,
+    'default': DefaultRule,
+}
+
+
+def _dict_fields(rule_cls) -> List[str]:
+    """Names of the dict-valued (context/conditions) fields of a rule dataclass."""
+    return [f.name for f in fields(rule_cls) if f.default_factory is dict]
+
+
+def rules_to_frame(rules: List[Any], rule_cls) -> pd.DataFrame:
+    """Flatten rule dicts or dataclasses into a table; dict fields become JSON text."""
+    records = [asdict(r) if is_dataclass(r) else r for r in rules]
+    df = pd.DataFrame(records, columns=[f.name for f in fields(rule_cls)])
+    for name in _dict_fields(rule_cls):
+        df[name] = [json.dumps(value) for value in df[name]]
+    return df
+
+
+def frame_to_rules(df: pd.DataFrame, rule_cls) -> List[Dict[str, Any]]:
+    """Inverse of rules_to_frame, returning rule dicts."""
+    df = df.astype(object).where(df.notna(), None)
+    records = df.to_dict('records')
+    for name in _dict_fields(rule_cls):
+        for record in records:
+            record[name] = json.loads(record[name])
+    return records
+
+
+# ln(rule_count + 1) for rule counts 1..N, shared by all coverage curves
+LOG_PENALTY_CACHE_SIZE = 200_000
+_LOG_PENALTY = np.log(np.arange(2, LOG_PENALTY_CACHE_SIZE + 2))
+
+
+def _log_penalty(n: int) -> np.ndarray:
+    """ln(k + 1) for k = 1..n, sliced from the module cache when it is long enough."""
+    if n <= LOG_PENALTY_CACHE_SIZE:
+        return _LOG_PENALTY[:n]
+    return np.log(np.arange(2, n + 2))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _progressive_metrics(freq: np.ndarray, conf: np.ndarray, total_events: int,
+                             log_penalty: np.ndarray):
+        """Cumulative coverage and progressive metrics of frequency-sorted rules, in one pass."""
+        n = freq.shape[0]
+        cumulative_coverage = np.empty(n, dtype=np.int64)
+        coverage_pct = np.empty(n)
+        avg_confidence = np.empty(n)
+        f1_score = np.empty(n)
+        efficiency = np.empty(n)
+        weighted_f1 = np.empty(n)
+        covered = 0
+        weighted_conf = 0.0
+        for i in range(n):
+            covered += freq[i]
+            weighted_conf += conf[i] * freq[i]
+            cov = covered / total_events * 100 if total_events > 0 else 0.0
+            acc = weighted_conf * 100 / covered if covered > 0 else 0.0
+            denom = cov + acc
+            f1 = 2 * cov * acc / denom if denom > 0 else 0.0
+            cumulative_coverage[i] = covered
+            coverage_pct[i] = cov
+            avg_confidence[i] = acc
+            f1_score[i] = f1
+            efficiency[i] = cov / (i + 1)
+            weighted_f1[i] = f1 / log_penalty[i]
+        return cumulative_coverage, coverage_pct, avg_confidence, f1_score, efficiency, weighted_f1
+else:
+    def _progressive_metrics(freq: np.ndarray, conf: np.ndarray, total_events: int,
+                             log_penalty: np.ndarray):
+        """Cumulative coverage and progressive metrics of frequency-sorted rules."""
+        rule_count = np.arange(1, len(freq) + 1)
+
+        cumulative_coverage = np.cumsum(freq)
+        cumulative_weighted_conf = np.cumsum(conf * freq)
+
+        zeros = np.zeros(len(freq))
+        coverage_pct = (cumulative_coverage / total_events * 100) if total_events > 0 else zeros
+        avg_confidence = np.divide(cumulative_weighted_conf * 100, cumulative_coverage,
+                                   out=zeros.copy(), where=cumulative_coverage > 0)
+
+        # F1-score: harmonic mean of coverage and accuracy
+        f1_denom = coverage_pct + avg_confidence
+        f1_score = np.divide(2 * coverage_pct * avg_confidence, f1_denom,
+                             out=zeros.copy(), where=f1_denom > 0)
+
+        # Efficiency: coverage per rule
+        efficiency = coverage_pct / rule_count
+
+        # Weighted F1: penalize large rule sets (logarithmic penalty for rule count)
+        weighted_f1 = f1_score / log_penalty
+
+        return cumulative_coverage, coverage_pct, avg_confidence, f1_score, efficiency, weighted_f1
+
+
+def progressive_metrics(freq: np.ndarray, conf: np.ndarray, total_events: int):
+    """
+    Progressive metrics for rules already sorted by descending frequency.
+
+    Returns (cumulative_coverage, coverage_pct, accuracy_pct, f1_score,
+    efficiency, weighted_f1) arrays, one entry per rule count.
+    """
+    return _progressive_metrics(freq, conf, total_events, _log_penalty(len(freq)))
 
 
 class ProgressiveCoverageAnalyzer:
@@ -42,8 +214,16 @@ class ProgressiveCoverageAnalyzer:
     def extract_rules_at_multiple_thresholds(self,
                                              systematicity_path: Path,
                                              morph_analysis_path: Path,
-                                             newspaper: str):
-        """Extract rules at multiple confidence/frequency thresholds."""
+                                             newspaper: str,
+                                             cache_dir: Path = None):
+        """Extract rules at multiple confidence/frequency thresholds.
+
+        If cache_dir is given, the loosest-threshold rule tables are kept
+        there as Parquet and reused while newer than both analysis files.
+
+        Returns (threshold results, total lexical events), so callers need
+        not parse the systematicity file again for the event total.
+        """
 
         print(f"\n{'='*80}")
         print(f"PROGRESSIVE RULE EXTRACTION: {newspaper}")
@@ -58,130 +238,189 @@ class ProgressiveCoverageAnalyzer:
             {'conf': 0.70, 'freq': 1, 'name': 'permissive'},
         ]
 
-        results = {}
+        # Extract once at the loosest threshold; stricter rule sets are
+        # subsets selected with boolean masks below
+        loosest_conf = min(t['conf'] for t in thresholds)
+        loosest_freq = min(t['freq'] for t in thresholds)
 
-        for threshold in thresholds:
-            print(f"\n--- Threshold: {threshold['name']} (conf={threshold['conf']:.0%}, freq={threshold['freq']}) ---")
+        cache_paths = None
+        if cache_dir is not None and PARQUET_AVAILABLE:
+            cache_paths = {
+                rule_type: Path(cache_dir) / f"{newspaper}_c{loosest_conf}_f{loosest_freq}_{rule_type}.parquet"
+                for rule_type in RULE_TYPES + ('totals',)
+            }
+
+        tables = self._load_rule_cache(cache_paths, [systematicity_path, morph_analysis_path])
+        if tables is not None:
+            print(f"   Loaded cached rule tables from {cache_dir}")
+            all_lex_syn = {
+                f'{rule_type}_rules': frame_to_rules(tables[rule_type], RULE_CLASSES[rule_type])
+                for rule_type in ('lexical', 'syntactic', 'default')
+            }
+            all_morph = [MorphologicalRule(**record)
+                         for record in frame_to_rules(tables['morphological'], MorphologicalRule)]
+            total_events = int(tables['totals']['total_events'].iloc[0])
+        else:
+            sys_data = load_json(systematicity_path)
+            morph_data = load_json(morph_analysis_path)
+            total_events = sys_data['by_granularity']['lexical']['total_events']
 
             # Extract lexical/syntactic rules
-            extractor = RuleExtractor(self.schema)
-            lex_syn_rules = extractor.extract_from_analysis(
-                systematicity_path,
-                min_confidence=threshold['conf'],
-                min_frequency=threshold['freq']
+            all_lex_syn = RuleExtractor(self.schema).extract_from_data(
+                sys_data, min_confidence=loosest_conf, min_frequency=loosest_freq
             )
 
             # Extract morphological rules
-            morph_extractor = MorphologicalRuleExtractor()
-            morph_rules = morph_extractor.extract_from_morphological_analysis(
-                morph_analysis_path,
-                min_confidence=threshold['conf'],
-                min_frequency=threshold['freq']
+            all_morph = MorphologicalRuleExtractor().extract_from_morphological_data(
+                morph_data, min_confidence=loosest_conf, min_frequency=loosest_freq
             )
 
+            tables = {
+                rule_type: rules_to_frame(all_lex_syn[f'{rule_type}_rules'], RULE_CLASSES[rule_type])
+                for rule_type in ('lexical', 'syntactic', 'default')
+            }
+            tables['morphological'] = rules_to_frame(all_morph, MorphologicalRule)
+            tables['totals'] = pd.DataFrame({'total_events': [total_events]})
+            if cache_paths is not None:
+                self._save_rule_cache(tables, cache_paths)
+
+        def conf_freq(table):
+            return (table['confidence'].to_numpy(dtype=np.float64),
+                    table['frequency'].to_numpy(dtype=np.int64))
+
+        lex_conf, lex_freq = conf_freq(tables['lexical'])
+        syn_conf, syn_freq = conf_freq(tables['syntactic'])
+        morph_conf, morph_freq = conf_freq(tables['morphological'])
+
+        results = {}
+
+        for threshold in thresholds:
+            lex_mask = (lex_conf >= threshold['conf']) & (lex_freq >= threshold['freq'])
+            syn_mask = (syn_conf >= threshold['conf']) & (syn_freq >= threshold['freq'])
+            morph_mask = (morph_conf >= threshold['conf']) & (morph_freq >= threshold['freq'])
+
+            lexical_rules = list(compress(all_lex_syn['lexical_rules'], lex_mask))
+            syntactic_rules = list(compress(all_lex_syn['syntactic_rules'], syn_mask))
+            default_rules = all_lex_syn['default_rules']  # threshold-independent
+            morph_rules = list(compress(all_morph, morph_mask))
+
+            lex_syn_rules = {
+                'lexical_rules': lexical_rules,
+                'syntactic_rules': syntactic_rules,
+                'default_rules': default_rules,
+                'statistics': {
+                    'total_rules': len(lexical_rules) + len(syntactic_rules) + len(default_rules),
+                    'lexical_count': len(lexical_rules),
+                    'syntactic_count': len(syntactic_rules),
+                    'default_count': len(default_rules),
+                    'lexical_coverage': int(lex_freq[lex_mask].sum()),
+                    'syntactic_coverage': int(syn_freq[syn_mask].sum()),
+                }
+            }
+
             results[threshold['name']] = {
                 'threshold': threshold,
-                'lexical_count': len(lex_syn_rules['lexical_rules']),
-                'syntactic_count': len(lex_syn_rules['syntactic_rules']),
+                'lexical_count': len(lexical_rules),
+                'syntactic_count': len(syntactic_rules),
                 'morphological_count': len(morph_rules),
-                'default_count': len(lex_syn_rules['default_rules']),
-                'total_rules': (len(lex_syn_rules['lexical_rules']) +
-                               len(lex_syn_rules['syntactic_rules']) +
+                'default_count': len(default_rules),
+                'total_rules': (len(lexical_rules) +
+                               len(syntactic_rules) +
                                len(morph_rules) +
-                               len(lex_syn_rules['default_rules'])),
-                'lexical_coverage': lex_syn_rules['statistics'].get('lexical_coverage', 0),
-                'syntactic_coverage': lex_syn_rules['statistics'].get('syntactic_coverage', 0),
+                               len(default_rules)),
+                'lexical_coverage': lex_syn_rules['statistics']['lexical_coverage'],
+                'syntactic_coverage': lex_syn_rules['statistics']['syntactic_coverage'],
                 'rules_data': lex_syn_rules,
                 'morph_rules': morph_rules
             }
 
-            print(f"   Total rules: {results[threshold['name']]['total_rules']}")
+        # Report all thresholds in one write, after the filtering is done
+        print(''.join(
+            f"\n--- Threshold: {r['threshold']['name']} (conf={r['threshold']['conf']:.0%}, "
+            f"freq={r['threshold']['freq']}) ---\n   Total rules: {r['total_rules']}\n"
+            for r in results.values()
+        ), end='')
 
         self.all_rules_data[newspaper] = results
-        return results
+        return results, total_events
+
+    def _load_rule_cache(self, cache_paths: Dict[str, Path],
+                         source_paths: List[Path]) -> Dict[str, pd.DataFrame]:
+        """Read cached rule tables, or None if any is missing or stale."""
+        if cache_paths is None:
+            return None
+        source_mtime = max(Path(p).stat().st_mtime for p in source_paths)
+        if not all(p.exists() and p.stat().st_mtime >= source_mtime for p in cache_paths.values()):
+            return None
+        return {rule_type: pd.read_parquet(path) for rule_type, path in cache_paths.items()}
+
+    def _save_rule_cache(self, tables: Dict[str, pd.DataFrame], cache_paths: Dict[str, Path]):
+        """Write rule tables to the Parquet cache; failures only cost a re-extraction."""
+        try:
+            for rule_type, path in cache_paths.items():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tables[rule_type].to_parquet(path, engine='pyarrow', compression='snappy', index=False)
+        except OSError as e:
+            print(f"   ⚠️  Could not write rule cache {path}: {e}")
 
     def compute_progressive_coverage(self,
                                      rules_data: Dict[str, Any],
-                                     total_events: int) -> pd.DataFrame:
+                                     total_events: int,
+                                     truncate_at_saturation: bool = False) -> pd.DataFrame:
         """
         Compute cumulative coverage as we add rules progressively.
 
+        With truncate_at_saturation, rows after the first rule that brings
+        cumulative coverage to 100% of total_events are elided. Rule
+        frequencies overlap, so coverage_pct can exceed 100% and F1 keep
+        rising past that point: truncation can move the optimum reported by
+        find_optimal_rule_count, and the curve no longer lines up with the
+        untruncated with-morphology curve. Off by default for that reason.
+
         Returns DataFrame with columns: rule_count, coverage, accuracy, f1_score
         """
 
-        # Combine all rules and sort by frequency
-        all_rules = []
-
-        # Add lexical rules
-        for rule in rules_data['lexical_rules']:
-            all_rules.append({
-                'type': 'lexical',
-                'frequency': rule['frequency'],
-                'confidence': rule['confidence']
-            })
-
-        # Add morphological rules (if available)
-        if 'morphological_rules' in rules_data:
-            for rule in rules_data['morphological_rules']:
-                all_rules.append({
-                    'type': 'morphological',
-                    'frequency': rule['frequency'],
-                    'confidence': rule['confidence']
-                })
-
-        # Add syntactic rules
-        for rule in rules_data['syntactic_rules']:
-            all_rules.append({
-                'type': 'syntactic',
-                'frequency': rule['frequency'],
-                'confidence': rule['confidence']
-            })
-
-        # Add default rules
-        for rule in rules_data['default_rules']:
-            all_rules.append({
-                'type': 'default',
-                'frequency': rule['frequency'],
-                'confidence': rule['confidence']
-            })
-
-        # Sort by frequency (descending)
-        all_rules.sort(key=lambda x: x['frequency'], reverse=True)
-
-        # Compute progressive metrics
-        progressive_data = []
-        cumulative_coverage = 0
-        cumulative_weighted_conf = 0
-
-        for i, rule in enumerate(all_rules, 1):
-            cumulative_coverage += rule['frequency']
-            cumulative_weighted_conf += rule['confidence'] * rule['frequency']
-
-            coverage_pct = (cumulative_coverage / total_events * 100) if total_events > 0 else 0
-            avg_confidence = (cumulative_weighted_conf / cumulative_coverage * 100) if cumulative_coverage > 0 else 0
-
-            # F1-score: harmonic mean of coverage and accuracy
-            f1_score = (2 * coverage_pct * avg_confidence / (coverage_pct + avg_confidence)) if (coverage_pct + avg_confidence) > 0 else 0
-
-            # Efficiency: coverage per rule
-            efficiency = coverage_pct / i if i > 0 else 0
-
-            # Weighted F1: penalize large rule sets
-            parsimony_penalty = 1 / np.log(i + 1)  # Logarithmic penalty for rule count
-            weighted_f1 = f1_score * parsimony_penalty
-
-            progressive_data.append({
-                'rule_count': i,
-                'rule_type': rule['type'],
-                'coverage_pct': coverage_pct,
-                'coverage_events': cumulative_coverage,
-                'accuracy_pct': avg_confidence,
-                'f1_score': f1_score,
-                'efficiency': efficiency,
-                'weighted_f1': weighted_f1
-            })
-
-        return pd.DataFrame(progressive_data)
+        # Combine all rules into typed arrays (rule type as an integer code)
+        rule_groups = [
+            rules_data['lexical_rules'],
+            rules_data.get('morphological_rules', []),  # if available
+            rules_data['syntactic_rules'],
+            rules_data['default_rules'],
+        ]
+        n_rules = sum(len(group) for group in rule_groups)
+        freq = np.fromiter(map(itemgetter('frequency'), chain.from_iterable(rule_groups)),
+                           dtype=np.int64, count=n_rules)
+        conf = np.fromiter(map(itemgetter('confidence'), chain.from_iterable(rule_groups)),
+                           dtype=np.float64, count=n_rules)
+        types = np.repeat(np.arange(len(RULE_TYPES)), [len(group) for group in rule_groups])
+
+        # Sort by frequency (descending, ties keep insertion order)
+        order = np.argsort(-freq, kind='stable')
+        freq, conf, types = freq[order], conf[order], types[order]
+
+        # Compute progressive metrics (fused kernel when numba is available)
+        (cumulative_coverage, coverage_pct, avg_confidence,
+         f1_score, efficiency, weighted_f1) = progressive_metrics(freq, conf, total_events)
+        rule_count = np.arange(1, len(freq) + 1)
+
+        # Optionally drop the rows past the rule reaching 100% coverage
+        if truncate_at_saturation and total_events > 0:
+            cutoff = min(int(np.searchsorted(cumulative_coverage, total_events)) + 1, len(freq))
+            rule_count, types = rule_count[:cutoff], types[:cutoff]
+            cumulative_coverage, coverage_pct = cumulative_coverage[:cutoff], coverage_pct[:cutoff]
+            avg_confidence, f1_score = avg_confidence[:cutoff], f1_score[:cutoff]
+            efficiency, weighted_f1 = efficiency[:cutoff], weighted_f1[:cutoff]
+
+        return pd.DataFrame({
+            'rule_count': rule_count,
+            'rule_type': np.array(RULE_TYPES)[types],
+            'coverage_pct': coverage_pct,
+            'coverage_events': cumulative_coverage,
+            'accuracy_pct': avg_confidence,
+            'f1_score': f1_score,
+            'efficiency': efficiency,
+            'weighted_f1': weighted_f1
+        })
 
     def find_optimal_rule_count(self,
                                 progressive_df: pd.DataFrame,
@@ -197,41 +436,54 @@ class ProgressiveCoverageAnalyzer:
             Dictionary with optimal point information
         """
 
+        columns = {col: progressive_df[col].to_numpy() for col in progressive_df.columns}
+
         # Find maximum
-        optimal_idx = progressive_df[metric].idxmax()
-        optimal_row = progressive_df.loc[optimal_idx]
+        optimal_pos = int(columns[metric].argmax())
 
-        # Also find some standard points
-        coverage_70_idx = progressive_df[progressive_df['coverage_pct'] >= 70].index.min() if not progressive_df[progressive_df['coverage_pct'] >= 70].empty else None
-        coverage_80_idx = progressive_df[progressive_df['coverage_pct'] >= 80].index.min() if not progressive_df[progressive_df['coverage_pct'] >= 80].empty else None
-        coverage_90_idx = progressive_df[progressive_df['coverage_pct'] >= 90].index.min() if not progressive_df[progressive_df['coverage_pct'] >= 90].empty else None
+        # Also find some standard points; coverage_pct is non-decreasing
+        coverage = columns['coverage_pct']
+
+        def row_at(pos: int) -> Dict[str, Any]:
+            return {col: values[pos].item() if isinstance(values[pos], np.generic) else values[pos]
+                    for col, values in columns.items()}
+
+        positions = np.searchsorted(coverage, np.array(COVERAGE_MILESTONES, dtype=np.float64))
+        milestones = {
+            f'coverage_{level}': row_at(pos) if pos < len(coverage) else None
+            for level, pos in zip(COVERAGE_MILESTONES, positions.tolist())
+        }
 
         return {
             'optimal': {
-                'rule_count': int(optimal_row['rule_count']),
-                'coverage': optimal_row['coverage_pct'],
-                'accuracy': optimal_row['accuracy_pct'],
-                metric: optimal_row[metric]
+                'rule_count': int(columns['rule_count'][optimal_pos]),
+                'coverage': coverage[optimal_pos],
+                'accuracy': columns['accuracy_pct'][optimal_pos],
+                metric: columns[metric][optimal_pos]
             },
-            'coverage_70': progressive_df.loc[coverage_70_idx].to_dict() if coverage_70_idx is not None else None,
-            'coverage_80': progressive_df.loc[coverage_80_idx].to_dict() if coverage_80_idx is not None else None,
-            'coverage_90': progressive_df.loc[coverage_90_idx].to_dict() if coverage_90_idx is not None else None,
+            **milestones,
         }
 
     def create_progressive_coverage_plot(self,
                                         progressive_df: pd.DataFrame,
                                         optimal_points: Dict[str, Any],
                                         newspaper: str,
-                                        output_dir: Path):
-        """Create visualization of progressive coverage."""
+                                        output_dir: Path,
+                                        dpi: int = 150):
+        """Create visualization of progressive coverage (PNG at the given dpi)."""
+
+        import matplotlib.pyplot as plt  # plotting-only dependency
 
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
 
+        # Decimate long curves for drawing, keeping the last rule
+        plot_df = decimate_for_plot(progressive_df)
+
         # Plot 1: Coverage and Accuracy vs Rule Count
         ax1_twin = ax1.twinx()
-        ax1.plot(progressive_df['rule_count'], progressive_df['coverage_pct'],
+        ax1.plot(plot_df['rule_count'], plot_df['coverage_pct'],
                 'b-', linewidth=2, label='Coverage (%)')
-        ax1_twin.plot(progressive_df['rule_count'], progressive_df['accuracy_pct'],
+        ax1_twin.plot(plot_df['rule_count'], plot_df['accuracy_pct'],
                      'r-', linewidth=2, label='Accuracy (%)')
 
         # Mark optimal point
@@ -248,9 +500,9 @@ class ProgressiveCoverageAnalyzer:
         ax1.grid(True, alpha=0.3)
 
         # Plot 2: F1-Score vs Rule Count
-        ax2.plot(progressive_df['rule_count'], progressive_df['f1_score'],
+        ax2.plot(plot_df['rule_count'], plot_df['f1_score'],
                 'purple', linewidth=2, label='F1-Score')
-        ax2.plot(progressive_df['rule_count'], progressive_df['weighted_f1'],
+        ax2.plot(plot_df['rule_count'], plot_df['weighted_f1'],
                 'orange', linewidth=2, label='Weighted F1 (penalized)')
 
         ax2.axvline(x=opt['rule_count'], color='green', linestyle='--', alpha=0.5, label=f"Optimal")
@@ -263,7 +515,7 @@ class ProgressiveCoverageAnalyzer:
         ax2.grid(True, alpha=0.3)
 
         # Plot 3: Efficiency (Coverage per Rule)
-        ax3.plot(progressive_df['rule_count'], progressive_df['efficiency'],
+        ax3.plot(plot_df['rule_count'], plot_df['efficiency'],
                 'teal', linewidth=2)
         ax3.axvline(x=opt['rule_count'], color='green', linestyle='--', alpha=0.5)
 
@@ -272,37 +524,44 @@ class ProgressiveCoverageAnalyzer:
         ax3.set_title(f'{newspaper}: Rule Efficiency', fontweight='bold')
         ax3.grid(True, alpha=0.3)
 
-        # Plot 4: Coverage Milestones
-        milestones = [10, 50, 100, 200, 500, 1000]
-        milestone_data = []
-        for m in milestones:
-            if m <= len(progressive_df):
-                row = progressive_df.iloc[m-1]
-                milestone_data.append({
-                    'Rules': m,
-                    'Coverage': row['coverage_pct'],
-                    'Accuracy': row['accuracy_pct']
-                })
-
-        if milestone_data:
-            mile_df = pd.DataFrame(milestone_data)
-            x = np.arange(len(milestone_data))
-            width = 0.35
-
-            ax4.bar(x - width/2, mile_df['Coverage'], width, label='Coverage %', color='steelblue')
-            ax4.bar(x + width/2, mile_df['Accuracy'], width, label='Accuracy %', color='coral')
-
-            ax4.set_xlabel('Number of Rules', fontweight='bold')
-            ax4.set_ylabel('Percentage', fontweight='bold')
+        # Plot 4: Coverage Milestones, limited to the range around the optimum
+        milestones = np.array([10, 50, 100, 200, 500, 1000])
+        milestone_cap = max(2 * opt['rule_count'], milestones[0])
+        milestones = milestones[(milestones <= len(progressive_df)) & (milestones <= milestone_cap)]
+
+        if len(milestones):
+            rows = progressive_df.iloc[milestones - 1]
+            mile_df = pd.DataFrame({
+                'Rules': milestones,
+                'Coverage': rows['coverage_pct'].to_numpy(),
+                'Accuracy': rows['accuracy_pct'].to_numpy(),
+            })
             ax4.set_title(f'{newspaper}: Coverage Milestones', fontweight='bold')
-            ax4.set_xticks(x)
-            ax4.set_xticklabels(mile_df['Rules'])
-            ax4.legend()
-            ax4.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
-        plt.savefig(output_dir / f'progressive_coverage_{newspaper}.png', dpi=300, bbox_inches='tight')
-        plt.close()
+            coverage_span = mile_df['Coverage'].max() - mile_df['Coverage'].min()
+            if len(milestones) > 1 and coverage_span < 1.0:
+                # Bars would all show the same saturated coverage
+                ax4.text(0.5, 0.5, 'All milestones saturated', transform=ax4.transAxes,
+                         ha='center', va='center', fontweight='bold')
+                ax4.set_xticks([])
+                ax4.set_yticks([])
+            else:
+                x = np.arange(len(milestones))
+                width = 0.35
+
+                ax4.bar(x - width/2, mile_df['Coverage'], width, label='Coverage %', color='steelblue')
+                ax4.bar(x + width/2, mile_df['Accuracy'], width, label='Accuracy %', color='coral')
+
+                ax4.set_xlabel('Number of Rules', fontweight='bold')
+                ax4.set_ylabel('Percentage', fontweight='bold')
+                ax4.set_xticks(x)
+                ax4.set_xticklabels(mile_df['Rules'])
+                ax4.legend()
+                ax4.grid(axis='y', alpha=0.3)
+
+        fig.tight_layout()
+        fig.savefig(output_dir / f'progressive_coverage_{newspaper}.png', dpi=dpi, bbox_inches='tight')
+        plt.close(fig)
 
         print(f"   ✅ Saved progressive coverage plot to: {output_dir / f'progressive_coverage_{newspaper}.png'}")
 
@@ -329,13 +588,76 @@ class ProgressiveCoverageAnalyzer:
             })
 
         df = pd.DataFrame(comparison_data)
-        df.to_csv(output_dir / 'optimal_rule_counts.csv', index=False)
+        save_table(df, output_dir / 'optimal_rule_counts.csv')
 
         print(f"\n   ✅ Saved optimal rule counts to: {output_dir / 'optimal_rule_counts.csv'}")
 
         return df
 
 
+def _analyze_newspaper(newspaper: str, schema, base_dir: Path, output_dir: Path) -> Dict[str, Any]:
+    """Run the progressive coverage analysis for one newspaper (process-pool worker).
+
+    The progressive table is written to disk here; only the optimal-point
+    summaries are returned. Returns None if the analysis files are missing.
+    """
+    analyzer = ProgressiveCoverageAnalyzer(schema)
+
+    print(f"\n{'='*80}")
+    print(f"ANALYZING: {newspaper}")
+    print(f"{'='*80}")
+
+    # Paths
+    sys_path = base_dir / "output" / newspaper / "rule_analysis" / "enhanced_systematicity.json"
+    morph_path = base_dir / "output" / newspaper / "morphological_analysis" / "morphological_analysis.json"
+
+    if not sys_path.exists() or not morph_path.exists():
+        print(f"   ⚠️  Missing analysis files for {newspaper}, skipping...")
+        return None
+
+    # Extract rules at multiple thresholds
+    # (total events come with them, read from the same parse or the rule cache)
+    threshold_results, total_events = analyzer.extract_rules_at_multiple_thresholds(
+        sys_path, morph_path, newspaper, cache_dir=output_dir / "rules_cache"
+    )
+
+    # Use default threshold for detailed analysis
+    rules_data = threshold_results['default']['rules_data']
+
+    # Compute progressive coverage
+    print(f"\n   Computing progressive coverage...")
+    progressive_df = analyzer.compute_progressive_coverage(rules_data, total_events)
+
+    # Find optimal points
+    print(f"\n   Finding optimal rule counts...")
+    optimal_f1 = analyzer.find_optimal_rule_count(progressive_df, metric='f1_score')
+    optimal_weighted_f1 = analyzer.find_optimal_rule_count(progressive_df, metric='weighted_f1')
+
+    print(f"\n   📊 Optimal Rule Count (F1-Score): {optimal_f1['optimal']['rule_count']}")
+    print(f"      Coverage: {optimal_f1['optimal']['coverage']:.1f}%")
+    print(f"      Accuracy: {optimal_f1['optimal']['accuracy']:.1f}%")
+    print(f"      F1-Score: {optimal_f1['optimal']['f1_score']:.1f}")
+
+    print(f"\n   📊 Optimal Rule Count (Weighted F1): {optimal_weighted_f1['optimal']['rule_count']}")
+    print(f"      Coverage: {optimal_weighted_f1['optimal']['coverage']:.1f}%")
+    print(f"      Accuracy: {optimal_weighted_f1['optimal']['accuracy']:.1f}%")
+
+    # Create visualizations
+    print(f"\n   Creating visualizations...")
+    analyzer.create_progressive_coverage_plot(
+        progressive_df, optimal_f1, newspaper, output_dir
+    )
+
+    # Save progressive data
+    save_table(progressive_df, output_dir / f'progressive_data_{newspaper}.csv')
+    print(f"   ✅ Saved progressive data to: {output_dir / f'progressive_data_{newspaper}.csv'}")
+
+    return {
+        'optimal_f1': optimal_f1,
+        'optimal_weighted_f1': optimal_weighted_f1,
+    }
+
+
 def main():
     """Run progressive coverage analysis for all newspapers."""
 
@@ -356,67 +678,20 @@ def main():
     print("PROGRESSIVE COVERAGE ANALYSIS")
     print("="*80)
 
-    all_newspaper_results = {}
-
-    for newspaper in newspapers:
-        print(f"\n{'='*80}")
-        print(f"ANALYZING: {newspaper}")
-        print(f"{'='*80}")
-
-        # Paths
-        sys_path = BASE_DIR / "output" / newspaper / "rule_analysis" / "enhanced_systematicity.json"
-        morph_path = BASE_DIR / "output" / newspaper / "morphological_analysis" / "morphological_analysis.json"
-
-        if not sys_path.exists() or not morph_path.exists():
-            print(f"   ⚠️  Missing analysis files for {newspaper}, skipping...")
-            continue
-
-        # Extract rules at multiple thresholds
-        threshold_results = analyzer.extract_rules_at_multiple_thresholds(
-            sys_path, morph_path, newspaper
-        )
-
-        # Use default threshold for detailed analysis
-        rules_data = threshold_results['default']['rules_data']
-
-        # Get total events
-        with open(sys_path, 'r') as f:
-            sys_data = json.load(f)
-        total_events = sys_data['by_granularity']['lexical']['total_events']
-
-        # Compute progressive coverage
-        print(f"\n   Computing progressive coverage...")
-        progressive_df = analyzer.compute_progressive_coverage(rules_data, total_events)
-
-        # Find optimal points
-        print(f"\n   Finding optimal rule counts...")
-        optimal_f1 = analyzer.find_optimal_rule_count(progressive_df, metric='f1_score')
-        optimal_weighted_f1 = analyzer.find_optimal_rule_count(progressive_df, metric='weighted_f1')
-
-        print(f"\n   📊 Optimal Rule Count (F1-Score): {optimal_f1['optimal']['rule_count']}")
-        print(f"      Coverage: {optimal_f1['optimal']['coverage']:.1f}%")
-        print(f"      Accuracy: {optimal_f1['optimal']['accuracy']:.1f}%")
-        print(f"      F1-Score: {optimal_f1['optimal']['f1_score']:.1f}")
-
-        print(f"\n   📊 Optimal Rule Count (Weighted F1): {optimal_weighted_f1['optimal']['rule_count']}")
-        print(f"      Coverage: {optimal_weighted_f1['optimal']['coverage']:.1f}%")
-        print(f"      Accuracy: {optimal_weighted_f1['optimal']['accuracy']:.1f}%")
-
-        # Create visualizations
-        print(f"\n   Creating visualizations...")
-        analyzer.create_progressive_coverage_plot(
-            progressive_df, optimal_f1, newspaper, output_dir
-        )
-
-        # Save progressive data
-        progressive_df.to_csv(output_dir / f'progressive_data_{newspaper}.csv', index=False)
-        print(f"   ✅ Saved progressive data to: {output_dir / f'progressive_data_{newspaper}.csv'}")
-
-        all_newspaper_results[newspaper] = {
-            'optimal_f1': optimal_f1,
-            'optimal_weighted_f1': optimal_weighted_f1,
-            'progressive_df': progressive_df
+    # Newspapers are independent, so analyze them in parallel processes;
+    # spawned workers start without any inherited matplotlib state
+    max_workers = min(len(newspapers), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = {
+            newspaper: executor.submit(_analyze_newspaper, newspaper, schema, BASE_DIR, output_dir)
+            for newspaper in newspapers
         }
+        all_newspaper_results = {}
+        for newspaper, future in futures.items():
+            result = future.result()
+            if result is not None:
+                all_newspaper_results[newspaper] = result
 
     # Create comparison table
     print(f"\n{'='*80}")
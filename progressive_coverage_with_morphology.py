@@ -7,18 +7,160 @@ and compares progressive coverage before/after morphological integration.
 """
 
 import json
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
 from typing import Dict, List, Any
+from itertools import chain
+from functools import lru_cache
+from operator import itemgetter
 import numpy as np
 
+from progressive_coverage_analyzer import (
+    PARQUET_AVAILABLE, RULE_TYPES, load_json, progressive_metrics, decimate_for_plot, save_table
+)
+
 # Set matplotlib backend
 import matplotlib
 matplotlib.use('Agg')
 
 
+# Compact dtypes for progressive tables; the metrics are only plotted and
+# summarised to one decimal, so single precision is enough
+PROGRESSIVE_DTYPES = {
+    'rule_count': 'int32',
+    'coverage_events': 'int64',
+    'coverage_pct': 'float32',
+    'accuracy_pct': 'float32',
+    'f1_score': 'float32',
+    'efficiency': 'float32',
+    'weighted_f1': 'float32',
+}
+
+# Columns of the previous (no-morphology) progressive data used for comparison
+PREVIOUS_RESULT_COLUMNS = ['rule_count', 'coverage_pct', 'accuracy_pct', 'f1_score', 'efficiency', 'weighted_f1']
+PREVIOUS_RESULT_DTYPES = {col: PROGRESSIVE_DTYPES[col] for col in PREVIOUS_RESULT_COLUMNS}
+
+
+@lru_cache(maxsize=16)
+def load_total_events(sys_path: str) -> int:
+    """Total events recorded in an enhanced_systematicity.json (0 if missing)."""
+    if not Path(sys_path).exists():
+        return 0
+    sys_data = load_json(sys_path)
+    # Use lexical granularity total events
+    if 'by_granularity' in sys_data and 'lexical' in sys_data['by_granularity']:
+        return sys_data['by_granularity']['lexical'].get('total_events', 0)
+    return sys_data.get('total_events', 0)
+
+
+def render_comparison_figure(newspaper: str,
+                             df_with_morph: pd.DataFrame,
+                             df_without_morph: pd.DataFrame,
+                             output_dir: Path) -> Path:
+    """Draw and save the before/after morphology figure (also runs in worker processes)."""
+    print(f"\n{'='*80}")
+    print(f"CREATING COMPARISON VISUALIZATION: {newspaper}")
+    print(f"{'='*80}\n")
+
+    # Create figure with 3x2 subplots
+    fig, axes = plt.subplots(3, 2, figsize=(16, 18))
+    fig.suptitle(f'Progressive Coverage: Before vs After Morphological Integration\n{newspaper}',
+                 fontsize=16, fontweight='bold')
+
+    # 1-4. Metric curves, without vs with morphology (long curves decimated)
+    plot_without = decimate_for_plot(df_without_morph)
+    plot_with = decimate_for_plot(df_with_morph)
+    x_without = plot_without['rule_count'].to_numpy()
+    x_with = plot_with['rule_count'].to_numpy()
+    line_panels = [
+        (axes[0, 0], 'coverage_pct', 'Coverage (%)', 'Coverage vs Rule Count'),
+        (axes[0, 1], 'accuracy_pct', 'Accuracy (%)', 'Accuracy vs Rule Count'),
+        (axes[1, 0], 'f1_score', 'F1-Score', 'F1-Score vs Rule Count'),
+        (axes[1, 1], 'efficiency', 'Efficiency (Coverage per Rule)', 'Efficiency vs Rule Count'),
+    ]
+    for ax, column, ylabel, title in line_panels:
+        ax.plot(x_without, plot_without[column].to_numpy(),
+                label='Without Morphology', color='steelblue', linewidth=2)
+        ax.plot(x_with, plot_with[column].to_numpy(),
+                label='With Morphology', color='coral', linewidth=2)
+        ax.set_xlabel('Number of Rules', fontweight='bold')
+        ax.set_ylabel(ylabel, fontweight='bold')
+        ax.set_title(title)
+        ax.legend()
+        ax.grid(alpha=0.3)
+
+    # 5. Rule type distribution (with morphology only)
+    ax5 = axes[2, 0]
+    rule_type_counts = df_with_morph.groupby('rule_type', observed=True)['rule_count'].count()
+    colors_map = {
+        'lexical': '#FF6B6B',
+        'morphological': '#4ECDC4',
+        'syntactic': '#95E1D3',
+        'default': '#F8B500'
+    }
+    colors = [colors_map.get(rt, '#999999') for rt in rule_type_counts.index]
+    ax5.pie(rule_type_counts.values, labels=rule_type_counts.index,
+           autopct='%1.1f%%', colors=colors, startangle=90)
+    ax5.set_title('Rule Type Distribution\n(With Morphology)')
+
+    # 6. Improvement metrics table
+    ax6 = axes[2, 1]
+    ax6.axis('tight')
+    ax6.axis('off')
+
+    # Calculate improvement metrics
+    max_coverage_without = df_without_morph['coverage_pct'].max()
+    max_coverage_with = df_with_morph['coverage_pct'].max()
+    coverage_improvement = max_coverage_with - max_coverage_without
+
+    max_f1_without = df_without_morph['f1_score'].max()
+    max_f1_with = df_with_morph['f1_score'].max()
+    f1_improvement = max_f1_with - max_f1_without
+
+    # Rules at optimal F1
+    optimal_without = df_without_morph.loc[df_without_morph['f1_score'].idxmax()]
+    optimal_with = df_with_morph.loc[df_with_morph['f1_score'].idxmax()]
+
+    table_data = [
+        ['Metric', 'Without Morph', 'With Morph', 'Improvement'],
+        ['Max Coverage', f"{max_coverage_without:.1f}%", f"{max_coverage_with:.1f}%", f"+{coverage_improvement:.1f}%"],
+        ['Max F1-Score', f"{max_f1_without:.1f}", f"{max_f1_with:.1f}", f"+{f1_improvement:.1f}"],
+        ['Rules @ Optimal F1', f"{optimal_without['rule_count']:.0f}", f"{optimal_with['rule_count']:.0f}", f"{optimal_with['rule_count'] - optimal_without['rule_count']:+.0f}"],
+        ['Coverage @ Opt F1', f"{optimal_without['coverage_pct']:.1f}%", f"{optimal_with['coverage_pct']:.1f}%", f"+{optimal_with['coverage_pct'] - optimal_without['coverage_pct']:.1f}%"],
+        ['Accuracy @ Opt F1', f"{optimal_without['accuracy_pct']:.1f}%", f"{optimal_with['accuracy_pct']:.1f}%", f"+{optimal_with['accuracy_pct'] - optimal_without['accuracy_pct']:.1f}%"]
+    ]
+
+    # Header row coloured at construction
+    cell_colours = [['#4ECDC4'] * 4] + [['white'] * 4] * (len(table_data) - 1)
+    table = ax6.table(cellText=table_data, cellColours=cell_colours, cellLoc='center', loc='center',
+                     colWidths=[0.3, 0.23, 0.23, 0.24])
+    table.auto_set_font_size(False)
+    table.set_fontsize(9)
+    table.scale(1, 2)
+
+    # Header text in bold white
+    for i in range(4):
+        table[(0, i)].set_text_props(weight='bold', color='white')
+
+    ax6.set_title('Improvement Summary', fontweight='bold', pad=20)
+
+    fig.tight_layout()
+
+    # Save
+    output_path = output_dir / f'comparison_{newspaper}.png'
+    fig.savefig(output_path, dpi=200)
+    plt.close(fig)
+
+    print(f"✅ Saved to: {output_path}")
+
+    return output_path
+
+
 class ProgressiveCoverageWithMorphology:
     """Analyzes progressive coverage with morphological features integrated."""
 
@@ -31,15 +173,27 @@ class ProgressiveCoverageWithMorphology:
         # Store results
         self.results = {}
         self.comparison_data = {}
+        self._previous_results = {}  # newspaper -> progressive data without morphology
+        self.previous_optimal = {}  # newspaper -> find_optimal_points of that data
 
     def load_previous_results(self, newspaper: str) -> pd.DataFrame:
-        """Load previous progressive coverage results (without morphology)."""
-        prev_path = self.project_root / 'output' / 'progressive_coverage_analysis' / f'progressive_data_{newspaper}.csv'
+        """Load previous progressive coverage results (without morphology), once per run."""
+        if newspaper in self._previous_results:
+            return self._previous_results[newspaper]
 
-        if prev_path.exists():
-            return pd.read_csv(prev_path)
+        prev_path = self.project_root / 'output' / 'progressive_coverage_analysis' / f'progressive_data_{newspaper}.csv'
+        parquet_path = prev_path.with_suffix('.parquet')
+
+        # Prefer the typed Parquet copy written alongside the CSV
+        if PARQUET_AVAILABLE and parquet_path.exists() and (
+                not prev_path.exists() or parquet_path.stat().st_mtime >= prev_path.stat().st_mtime):
+            df = pd.read_parquet(parquet_path, columns=PREVIOUS_RESULT_COLUMNS).astype(PREVIOUS_RESULT_DTYPES)
+        elif prev_path.exists():
+            df = pd.read_csv(prev_path, usecols=PREVIOUS_RESULT_COLUMNS, dtype=PREVIOUS_RESULT_DTYPES)
         else:
-            return pd.DataFrame()
+            df = pd.DataFrame()
+        self._previous_results[newspaper] = df
+        return df
 
     def extract_morphological_rules(self, newspaper: str) -> List[Dict]:
         """Extract morphological rules from morphological analysis."""
@@ -51,22 +205,26 @@ class ProgressiveCoverageWithMorphology:
 
         df = pd.read_csv(morph_path)
 
-        rules = []
-        for i, row in enumerate(df.iterrows(), 1):
-            _, row_data = row
-            rule = {
+        # 'pos' and 'confidence' are optional columns
+        n_rules = len(df)
+        pos = df['pos'].tolist() if 'pos' in df.columns else ['N/A'] * n_rules
+        confidence = df['confidence'].tolist() if 'confidence' in df.columns else [1.0] * n_rules
+
+        return [
+            {
                 'rule_id': f"MORPH_{i:04d}",
-                'pos': row_data.get('pos', 'N/A'),  # Use 'pos' if available, otherwise 'N/A'
-                'morph_feature': row_data['feature'],
-                'headline_value': row_data['headline_value'],
-                'canonical_value': row_data['canonical_value'],
-                'confidence': row_data.get('confidence', 1.0),  # Use confidence from CSV or default to 1.0
-                'frequency': row_data['frequency'],
+                'pos': p,
+                'morph_feature': feature,
+                'headline_value': headline_value,
+                'canonical_value': canonical_value,
+                'confidence': conf,
+                'frequency': freq,
                 'rule_type': 'morphological'
             }
-            rules.append(rule)
-
-        return rules
+            for i, (p, feature, headline_value, canonical_value, conf, freq) in enumerate(
+                zip(pos, df['feature'].tolist(), df['headline_value'].tolist(),
+                    df['canonical_value'].tolist(), confidence, df['frequency'].tolist()), 1)
+        ]
 
     def extract_lexical_syntactic_rules(self, newspaper: str) -> Dict[str, List[Dict]]:
         """Extract lexical and syntactic rules from rule analysis."""
@@ -95,109 +253,50 @@ class ProgressiveCoverageWithMorphology:
         other_rules = self.extract_lexical_syntactic_rules(newspaper)
         morph_rules = self.extract_morphological_rules(newspaper)
 
-        # Combine all rules
-        all_rules = []
-
-        # Add lexical rules
-        for i, rule in enumerate(other_rules['lexical'], 1):
-            all_rules.append({
-                'rule_id': f"LEX_{i:04d}",
-                'rule_type': 'lexical',
-                'frequency': rule['frequency'],
-                'confidence': rule['confidence']
-            })
-
-        # Add morphological rules
-        for rule in morph_rules:
-            all_rules.append({
-                'rule_id': rule['rule_id'],
-                'rule_type': 'morphological',
-                'frequency': rule['frequency'],
-                'confidence': rule['confidence']
-            })
-
-        # Add syntactic rules
-        for i, rule in enumerate(other_rules['syntactic'], 1):
-            all_rules.append({
-                'rule_id': f"SYN_{i:04d}",
-                'rule_type': 'syntactic',
-                'frequency': rule['frequency'],
-                'confidence': rule['confidence']
-            })
-
-        # Add default rules
-        for i, rule in enumerate(other_rules['default'], 1):
-            all_rules.append({
-                'rule_id': f"DEF_{i:04d}",
-                'rule_type': 'default',
-                'frequency': rule['frequency'],
-                'confidence': rule['confidence']
-            })
-
-        # Sort by frequency (highest first)
-        all_rules.sort(key=lambda r: r['frequency'], reverse=True)
+        # Combine all rules into typed arrays (rule type as an index into RULE_TYPES)
+        rule_groups = [other_rules['lexical'], morph_rules, other_rules['syntactic'], other_rules['default']]
+        n_rules = sum(len(group) for group in rule_groups)
+        freq = np.fromiter(map(itemgetter('frequency'), chain.from_iterable(rule_groups)),
+                           dtype=np.int64, count=n_rules)
+        conf = np.fromiter(map(itemgetter('confidence'), chain.from_iterable(rule_groups)),
+                           dtype=np.float64, count=n_rules)
+        types = np.repeat(np.arange(len(RULE_TYPES)), [len(group) for group in rule_groups])
+
+        # Sort by frequency (highest first, ties keep insertion order)
+        order = np.argsort(-freq, kind='stable')
+        freq, conf, types = freq[order], conf[order], types[order]
 
         # Get total events from enhanced systematicity
         sys_path = self.project_root / 'output' / newspaper / 'rule_analysis' / 'enhanced_systematicity.json'
-        total_events = 0
-        if sys_path.exists():
-            with open(sys_path, 'r') as f:
-                sys_data = json.load(f)
-                # Use lexical granularity total events
-                if 'by_granularity' in sys_data and 'lexical' in sys_data['by_granularity']:
-                    total_events = sys_data['by_granularity']['lexical'].get('total_events', 0)
-                else:
-                    total_events = sys_data.get('total_events', 0)
+        total_events = load_total_events(str(sys_path))
 
         if total_events == 0:
             print(f"⚠️  Could not determine total events for {newspaper}")
             return pd.DataFrame()
 
-        print(f"Total rules: {len(all_rules)}")
+        print(f"Total rules: {n_rules}")
         print(f"  - Lexical: {len(other_rules['lexical'])}")
         print(f"  - Morphological: {len(morph_rules)}")
         print(f"  - Syntactic: {len(other_rules['syntactic'])}")
         print(f"  - Default: {len(other_rules['default'])}")
         print(f"Total events: {total_events}")
 
-        # Compute progressive coverage
-        rows = []
-        cumulative_coverage = 0
-        cumulative_weighted_confidence = 0
-
-        for i, rule in enumerate(all_rules, 1):
-            cumulative_coverage += rule['frequency']
-            cumulative_weighted_confidence += rule['frequency'] * rule['confidence']
-
-            coverage_pct = 100 * cumulative_coverage / total_events
-            accuracy_pct = 100 * (cumulative_weighted_confidence / cumulative_coverage if cumulative_coverage > 0 else 0)
-
-            # F1-score
-            if coverage_pct + accuracy_pct > 0:
-                f1_score = 2 * coverage_pct * accuracy_pct / (coverage_pct + accuracy_pct)
-            else:
-                f1_score = 0
-
-            # Efficiency
-            efficiency = coverage_pct / i
-
-            # Weighted F1 with parsimony penalty
-            parsimony_penalty = 1 / np.log(i + 1)
-            weighted_f1 = f1_score * parsimony_penalty
+        # Compute progressive coverage (fused kernel shared with the analyzer)
+        rule_count = np.arange(1, n_rules + 1)
 
-            row = {
-                'rule_count': i,
-                'rule_type': rule['rule_type'],
-                'coverage_pct': coverage_pct,
-                'coverage_events': cumulative_coverage,
-                'accuracy_pct': accuracy_pct,
-                'f1_score': f1_score,
-                'efficiency': efficiency,
-                'weighted_f1': weighted_f1
-            }
-            rows.append(row)
+        (cumulative_coverage, coverage_pct, accuracy_pct,
+         f1_score, efficiency, weighted_f1) = progressive_metrics(freq, conf, total_events)
 
-        df = pd.DataFrame(rows)
+        df = pd.DataFrame({
+            'rule_count': rule_count,
+            'rule_type': pd.Categorical.from_codes(types, categories=RULE_TYPES),
+            'coverage_pct': coverage_pct,
+            'coverage_events': cumulative_coverage,
+            'accuracy_pct': accuracy_pct,
+            'f1_score': f1_score,
+            'efficiency': efficiency,
+            'weighted_f1': weighted_f1
+        }).astype(PROGRESSIVE_DTYPES)
 
         print(f"\n✅ Progressive coverage computed")
         print(f"   Rule count: {len(df)}")
@@ -211,172 +310,69 @@ class ProgressiveCoverageWithMorphology:
         if len(progressive_df) == 0:
             return {}
 
-        # Find optimal F1
-        optimal_f1_idx = progressive_df['f1_score'].idxmax()
-        optimal_f1_row = progressive_df.loc[optimal_f1_idx]
-
-        # Find optimal weighted F1
-        optimal_weighted_idx = progressive_df['weighted_f1'].idxmax()
-        optimal_weighted_row = progressive_df.loc[optimal_weighted_idx]
-
-        # Coverage milestones
-        milestones = {}
-        for target in [70, 80, 90]:
-            milestone_rows = progressive_df[progressive_df['coverage_pct'] >= target]
-            if len(milestone_rows) > 0:
-                milestones[target] = milestone_rows.iloc[0]['rule_count']
-            else:
-                milestones[target] = len(progressive_df)
+        rule_count = progressive_df['rule_count'].to_numpy()
+        coverage = progressive_df['coverage_pct'].to_numpy()
+        accuracy = progressive_df['accuracy_pct'].to_numpy()
+        f1_score = progressive_df['f1_score'].to_numpy()
+        weighted_f1 = progressive_df['weighted_f1'].to_numpy()
+
+        # Optimal F1 and weighted F1 (first maximum, as idxmax)
+        best_f1 = int(f1_score.argmax())
+        best_weighted = int(weighted_f1.argmax())
+
+        # Coverage milestones; coverage_pct is non-decreasing
+        targets = [70, 80, 90]
+        positions = np.searchsorted(coverage, np.array(targets, dtype=coverage.dtype))
+        milestones = {
+            target: rule_count[pos] if pos < len(rule_count) else len(progressive_df)
+            for target, pos in zip(targets, positions.tolist())
+        }
 
         return {
             'optimal_f1': {
-                'rule_count': optimal_f1_row['rule_count'],
-                'coverage': optimal_f1_row['coverage_pct'],
-                'accuracy': optimal_f1_row['accuracy_pct'],
-                'f1_score': optimal_f1_row['f1_score']
+                'rule_count': rule_count[best_f1],
+                'coverage': coverage[best_f1],
+                'accuracy': accuracy[best_f1],
+                'f1_score': f1_score[best_f1]
             },
             'optimal_weighted_f1': {
-                'rule_count': optimal_weighted_row['rule_count'],
-                'coverage': optimal_weighted_row['coverage_pct'],
-                'accuracy': optimal_weighted_row['accuracy_pct'],
-                'weighted_f1': optimal_weighted_row['weighted_f1']
+                'rule_count': rule_count[best_weighted],
+                'coverage': coverage[best_weighted],
+                'accuracy': accuracy[best_weighted],
+                'weighted_f1': weighted_f1[best_weighted]
             },
-            'milestones': milestones
+            'milestones': milestones,
+            'max_coverage': coverage.max()
         }
 
-    def create_comparison_visualization(self, newspaper: str):
-        """Create visualization comparing before/after morphology integration."""
-        print(f"\n{'='*80}")
-        print(f"CREATING COMPARISON VISUALIZATION: {newspaper}")
-        print(f"{'='*80}\n")
+    def _optimal_points_pair(self, newspaper: str):
+        """Optimal points with and without morphology, each computed once per run."""
+        if newspaper not in self.comparison_data and newspaper in self.results:
+            self.comparison_data[newspaper] = self.find_optimal_points(self.results[newspaper])
+        if newspaper not in self.previous_optimal:
+            self.previous_optimal[newspaper] = self.find_optimal_points(self.load_previous_results(newspaper))
+        return self.comparison_data.get(newspaper), self.previous_optimal[newspaper]
 
-        # Load data
+    def _comparison_inputs(self, newspaper: str):
+        """Progressive tables (with, without morphology) to compare, or None if either is missing."""
         df_with_morph = self.results.get(newspaper)
         df_without_morph = self.load_previous_results(newspaper)
 
         if df_with_morph is None or len(df_with_morph) == 0:
             print(f"⚠️  No results with morphology for {newspaper}")
-            return
+            return None
 
         if df_without_morph is None or len(df_without_morph) == 0:
             print(f"⚠️  No previous results for {newspaper}")
-            return
+            return None
 
-        # Create figure with 3x2 subplots
-        fig, axes = plt.subplots(3, 2, figsize=(16, 18))
-        fig.suptitle(f'Progressive Coverage: Before vs After Morphological Integration\n{newspaper}',
-                     fontsize=16, fontweight='bold')
+        return df_with_morph, df_without_morph
 
-        # 1. Coverage comparison
-        ax1 = axes[0, 0]
-        ax1.plot(df_without_morph['rule_count'], df_without_morph['coverage_pct'],
-                label='Without Morphology', color='steelblue', linewidth=2)
-        ax1.plot(df_with_morph['rule_count'], df_with_morph['coverage_pct'],
-                label='With Morphology', color='coral', linewidth=2)
-        ax1.set_xlabel('Number of Rules', fontweight='bold')
-        ax1.set_ylabel('Coverage (%)', fontweight='bold')
-        ax1.set_title('Coverage vs Rule Count')
-        ax1.legend()
-        ax1.grid(alpha=0.3)
-
-        # 2. Accuracy comparison
-        ax2 = axes[0, 1]
-        ax2.plot(df_without_morph['rule_count'], df_without_morph['accuracy_pct'],
-                label='Without Morphology', color='steelblue', linewidth=2)
-        ax2.plot(df_with_morph['rule_count'], df_with_morph['accuracy_pct'],
-                label='With Morphology', color='coral', linewidth=2)
-        ax2.set_xlabel('Number of Rules', fontweight='bold')
-        ax2.set_ylabel('Accuracy (%)', fontweight='bold')
-        ax2.set_title('Accuracy vs Rule Count')
-        ax2.legend()
-        ax2.grid(alpha=0.3)
-
-        # 3. F1-score comparison
-        ax3 = axes[1, 0]
-        ax3.plot(df_without_morph['rule_count'], df_without_morph['f1_score'],
-                label='Without Morphology', color='steelblue', linewidth=2)
-        ax3.plot(df_with_morph['rule_count'], df_with_morph['f1_score'],
-                label='With Morphology', color='coral', linewidth=2)
-        ax3.set_xlabel('Number of Rules', fontweight='bold')
-        ax3.set_ylabel('F1-Score', fontweight='bold')
-        ax3.set_title('F1-Score vs Rule Count')
-        ax3.legend()
-        ax3.grid(alpha=0.3)
-
-        # 4. Efficiency comparison
-        ax4 = axes[1, 1]
-        ax4.plot(df_without_morph['rule_count'], df_without_morph['efficiency'],
-                label='Without Morphology', color='steelblue', linewidth=2)
-        ax4.plot(df_with_morph['rule_count'], df_with_morph['efficiency'],
-                label='With Morphology', color='coral', linewidth=2)
-        ax4.set_xlabel('Number of Rules', fontweight='bold')
-        ax4.set_ylabel('Efficiency (Coverage per Rule)', fontweight='bold')
-        ax4.set_title('Efficiency vs Rule Count')
-        ax4.legend()
-        ax4.grid(alpha=0.3)
-
-        # 5. Rule type distribution (with morphology only)
-        ax5 = axes[2, 0]
-        rule_type_counts = df_with_morph.groupby('rule_type')['rule_count'].count()
-        colors_map = {
-            'lexical': '#FF6B6B',
-            'morphological': '#4ECDC4',
-            'syntactic': '#95E1D3',
-            'default': '#F8B500'
-        }
-        colors = [colors_map.get(rt, '#999999') for rt in rule_type_counts.index]
-        ax5.pie(rule_type_counts.values, labels=rule_type_counts.index,
-               autopct='%1.1f%%', colors=colors, startangle=90)
-        ax5.set_title('Rule Type Distribution\n(With Morphology)')
-
-        # 6. Improvement metrics table
-        ax6 = axes[2, 1]
-        ax6.axis('tight')
-        ax6.axis('off')
-
-        # Calculate improvement metrics
-        max_coverage_without = df_without_morph['coverage_pct'].max()
-        max_coverage_with = df_with_morph['coverage_pct'].max()
-        coverage_improvement = max_coverage_with - max_coverage_without
-
-        max_f1_without = df_without_morph['f1_score'].max()
-        max_f1_with = df_with_morph['f1_score'].max()
-        f1_improvement = max_f1_with - max_f1_without
-
-        # Rules at optimal F1
-        optimal_without = df_without_morph.loc[df_without_morph['f1_score'].idxmax()]
-        optimal_with = df_with_morph.loc[df_with_morph['f1_score'].idxmax()]
-
-        table_data = [
-            ['Metric', 'Without Morph', 'With Morph', 'Improvement'],
-            ['Max Coverage', f"{max_coverage_without:.1f}%", f"{max_coverage_with:.1f}%", f"+{coverage_improvement:.1f}%"],
-            ['Max F1-Score', f"{max_f1_without:.1f}", f"{max_f1_with:.1f}", f"+{f1_improvement:.1f}"],
-            ['Rules @ Optimal F1', f"{optimal_without['rule_count']:.0f}", f"{optimal_with['rule_count']:.0f}", f"{optimal_with['rule_count'] - optimal_without['rule_count']:+.0f}"],
-            ['Coverage @ Opt F1', f"{optimal_without['coverage_pct']:.1f}%", f"{optimal_with['coverage_pct']:.1f}%", f"+{optimal_with['coverage_pct'] - optimal_without['coverage_pct']:.1f}%"],
-            ['Accuracy @ Opt F1', f"{optimal_without['accuracy_pct']:.1f}%", f"{optimal_with['accuracy_pct']:.1f}%", f"+{optimal_with['accuracy_pct'] - optimal_without['accuracy_pct']:.1f}%"]
-        ]
-
-        table = ax6.table(cellText=table_data, cellLoc='center', loc='center',
-                         colWidths=[0.3, 0.23, 0.23, 0.24])
-        table.auto_set_font_size(False)
-        table.set_fontsize(9)
-        table.scale(1, 2)
-
-        # Style header row
-        for i in range(4):
-            table[(0, i)].set_facecolor('#4ECDC4')
-            table[(0, i)].set_text_props(weight='bold', color='white')
-
-        ax6.set_title('Improvement Summary', fontweight='bold', pad=20)
-
-        plt.tight_layout()
-
-        # Save
-        output_path = self.output_dir / f'comparison_{newspaper}.png'
-        plt.savefig(output_path, dpi=200)
-        plt.close()
-
-        print(f"✅ Saved to: {output_path}")
+    def create_comparison_visualization(self, newspaper: str):
+        """Create visualization comparing before/after morphology integration."""
+        inputs = self._comparison_inputs(newspaper)
+        if inputs is not None:
+            render_comparison_figure(newspaper, *inputs, self.output_dir)
 
     def create_summary_table(self):
         """Create summary comparison table across all newspapers."""
@@ -387,26 +383,22 @@ class ProgressiveCoverageWithMorphology:
         rows = []
 
         for newspaper in self.newspapers:
-            df_with = self.results.get(newspaper)
-            df_without = self.load_previous_results(newspaper)
+            optimal_with, optimal_without = self._optimal_points_pair(newspaper)
 
-            if df_with is None or df_without is None or df_without.empty:
+            if not optimal_with or not optimal_without:
                 continue
 
-            # Calculate metrics
-            max_coverage_without = df_without['coverage_pct'].max()
-            max_coverage_with = df_with['coverage_pct'].max()
+            # Calculate metrics from the optimal points found for each table
+            max_coverage_without = optimal_without['max_coverage']
+            max_coverage_with = optimal_with['max_coverage']
             coverage_improvement = max_coverage_with - max_coverage_without
 
-            max_f1_without = df_without['f1_score'].max()
-            max_f1_with = df_with['f1_score'].max()
+            max_f1_without = optimal_without['optimal_f1']['f1_score']
+            max_f1_with = optimal_with['optimal_f1']['f1_score']
             f1_improvement = max_f1_with - max_f1_without
 
-            optimal_without = df_without.loc[df_without['f1_score'].idxmax()]
-            optimal_with = df_with.loc[df_with['f1_score'].idxmax()]
-
             # Count morphological rules
-            morph_rules = len(df_with[df_with['rule_type'] == 'morphological'])
+            morph_rules = int((self.results[newspaper]['rule_type'] == 'morphological').sum())
 
             row = {
                 'Newspaper': newspaper,
@@ -417,8 +409,8 @@ class ProgressiveCoverageWithMorphology:
                 'F1 (No Morph)': f"{max_f1_without:.1f}",
                 'F1 (With Morph)': f"{max_f1_with:.1f}",
                 'F1 Improvement': f"+{f1_improvement:.1f}",
-                'Opt Rules (No Morph)': int(optimal_without['rule_count']),
-                'Opt Rules (With Morph)': int(optimal_with['rule_count'])
+                'Opt Rules (No Morph)': int(optimal_without['optimal_f1']['rule_count']),
+                'Opt Rules (With Morph)': int(optimal_with['optimal_f1']['rule_count'])
             }
             rows.append(row)
 
@@ -426,7 +418,7 @@ class ProgressiveCoverageWithMorphology:
 
         # Save
         csv_path = self.output_dir / 'improvement_summary.csv'
-        df.to_csv(csv_path, index=False)
+        save_table(df, csv_path)
         print(f"✅ Saved to: {csv_path}")
 
         return df
@@ -450,11 +442,22 @@ class ProgressiveCoverageWithMorphology:
 
                 # Save progressive data
                 csv_path = self.output_dir / f'progressive_data_with_morphology_{newspaper}.csv'
-                df.to_csv(csv_path, index=False)
+                save_table(df, csv_path)
                 print(f"✅ Saved progressive data to: {csv_path}")
 
-                # Create comparison visualization
-                self.create_comparison_visualization(newspaper)
+        # Create comparison visualizations, one spawned process per newspaper
+        figure_inputs = {newspaper: self._comparison_inputs(newspaper) for newspaper in self.results}
+        figure_inputs = {newspaper: inputs for newspaper, inputs in figure_inputs.items() if inputs is not None}
+        if figure_inputs:
+            max_workers = min(len(figure_inputs), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = [
+                    executor.submit(render_comparison_figure, newspaper, *inputs, self.output_dir)
+                    for newspaper, inputs in figure_inputs.items()
+                ]
+                for future in futures:
+                    future.result()
 
         # Create summary table
         if len(self.results) > 0:
@@ -1,10 +1,46 @@
-
-# Version 1
-
-from collections import defaultdict
-from typing import List, Dict, Any
+import math
+from collections import Counter
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Iterable, Iterator
+import numpy as np
+import pandas as pd
 from register_comparison.comparators.comparator import DifferenceEvent
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Event attributes also kept column-wise for vectorized counting
+EVENT_COLUMNS = ('newspaper', 'sent_id', 'parse_type', 'feature_id', 'canonical_value', 'headline_value')
+
+# Key columns of the per-combination event summary every count is projected from
+# (each row also carries the value_pair its canonical/headline values format to)
+SUMMARY_KEYS = ('newspaper', 'parse_type', 'feature_id', 'canonical_value', 'headline_value')
+
+_feature_id = attrgetter('feature_id')
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _entropy_bits(counts: np.ndarray) -> float:
+        """Shannon entropy (bits) of a count array with a positive total, in one compiled loop."""
+        total = 0.0
+        for c in counts:
+            total += c
+        entropy = 0.0
+        for c in counts:
+            if c > 0:
+                p = c / total
+                entropy -= p * np.log2(p)
+        return entropy
+else:
+    def _entropy_bits(counts: np.ndarray) -> float:
+        """Shannon entropy (bits) of a count array with a positive total."""
+        p = counts[counts > 0] / counts.sum()
+        return float(-(p * np.log2(p)).sum())
+
 class Aggregator:
     """
     Aggregates DifferenceEvent records into summary counts and matrices
@@ -12,166 +48,266 @@ class Aggregator:
     """
 
     def __init__(self):
-        # Stores aggregated data
-        self.by_newspaper: Dict[str, List[DifferenceEvent]] = defaultdict(list)
-        self.by_parse_type: Dict[str, List[DifferenceEvent]] = defaultdict(list)
+        # Stores aggregated data; per-newspaper / per-parse-type groups are built on demand
         self.global_events: List[DifferenceEvent] = []
+        self._column_values: Dict[str, List[Any]] = {name: [] for name in EVENT_COLUMNS}
+        self._codes: Dict[str, Any] = {}
+        self._indices: Dict[str, Any] = {}
+        self._groups: Dict[str, Dict[str, List[DifferenceEvent]]] = {}
+        self._value_pair_counts: Dict[Any, tuple] = {}
+        self._value_pair_types: Dict[str, str] = {}
 
     def add_events(self, events: List[DifferenceEvent]):
         """
-        Add a list of DifferenceEvent objects to the aggregators.
+        Add a list of DifferenceEvent objects to the aggregator.
         """
-        for ev in events:
-            self.by_newspaper[ev.newspaper].append(ev)
-            self.by_parse_type[ev.parse_type].append(ev)
-            self.global_events.append(ev)
+        self.global_events.extend(events)
+        for name, values in self._column_values.items():
+            values.extend(map(attrgetter(name), events))
+        self._invalidate_indices()
 
-    def feature_counts(self, events: List[DifferenceEvent]) -> Dict[str, int]:
+    def _invalidate_indices(self):
         """
-        Count how many times each feature appears in a given list of events.
+        Drop the cached codes and groupings after new events arrive.
         """
-        counts = defaultdict(int)
-        for ev in events:
-            counts[ev.feature_id] += 1
-        return dict(counts)
-
-    def per_newspaper_counts(self) -> Dict[str, Dict[str, int]]:
+        self._codes.clear()
+        self._indices.clear()
+        self._groups.clear()
+        self._value_pair_counts.clear()
+        self._value_pair_types.clear()
+
+    @staticmethod
+    def _first_positions(codes: np.ndarray) -> np.ndarray:
         """
-        Get feature frequency counts for each newspaper.
+        Position of the first occurrence of each code, in code order.
         """
-        result = {}
-        for newspaper, evs in self.by_newspaper.items():
-            result[newspaper] = self.feature_counts(evs)
-        return result
+        return np.flatnonzero(~pd.Series(codes).duplicated().to_numpy())
 
-    def per_parse_type_counts(self) -> Dict[str, Dict[str, int]]:
+    @classmethod
+    def _factorize(cls, values: np.ndarray):
         """
-        Get feature frequency counts for each parse type (dep/const).
+        Integer codes for an object array, with the distinct values in order
+        of first appearance.
         """
-        result = {}
-        for ptype, evs in self.by_parse_type.items():
-            result[ptype] = self.feature_counts(evs)
-        return result
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        # factorize reports None as NaN; take the distinct values from the input itself
+        if pd.isna(uniques).any():
+            uniques = values[cls._first_positions(codes)]
+        # Narrowest signed dtype holding every code, as pandas Categorical does
+        return codes.astype(np.min_scalar_type(-len(uniques))), uniques
+
+    @staticmethod
+    def _combine_codes(outer: np.ndarray, inner: np.ndarray, width: int) -> np.ndarray:
+        """
+        One int64 code per (outer, inner) code pair, where inner codes are below width.
+        """
+        return outer.astype(np.int64) * width + inner
 
-    def global_counts(self) -> Dict[str, int]:
+    def _column(self, name: str) -> np.ndarray:
         """
-        Get feature frequency counts across all events.
+        One event attribute over global_events as an object array.
         """
-        return self.feature_counts(self.global_events)
+        return np.fromiter(self._column_values[name], dtype=object, count=len(self.global_events))
 
-    def to_matrix(self, events: List[DifferenceEvent]) -> List[Dict[str, Any]]:
+    def _factorized(self, attr: str):
         """
-        Convert events into a list of dicts for CSV/DF creation.
+        Integer codes for a column of global_events, with the distinct values
+        in order of first appearance. Only the codes and distinct values are
+        cached; the object column is rebuilt if the codes are invalidated.
+        'value_pair' is the derived "canonical→headline" key.
+        """
+        if attr not in self._codes:
+            if attr == 'value_pair':
+                self._codes[attr] = self._factorize_value_pairs()
+            else:
+                self._codes[attr] = self._factorize(self._column(attr))
+        return self._codes[attr]
+
+    def _factorize_value_pairs(self):
+        """
+        Codes for the "canonical→headline" key, formatting one string per
+        distinct (canonical, headline) combination rather than one per event.
         """
-        return [ev.to_dict() for ev in events]
+        canonical_codes, canonical_values = self._factorized('canonical_value')
+        headline_codes, headline_values = self._factorized('headline_value')
+        width = max(len(headline_values), 1)
+        pair_codes, combos = pd.factorize(self._combine_codes(canonical_codes, headline_codes, width))
+        keys = np.fromiter((f"{canonical}→{headline}" for canonical, headline in
+                            zip(canonical_values[combos // width].tolist(), headline_values[combos % width].tolist())),
+                           dtype=object, count=len(combos))
+        # Distinct combinations can still format to the same key (e.g. 1 and '1')
+        key_codes, uniques = self._factorize(keys)
+        return key_codes[pair_codes], uniques
+
+    @staticmethod
+    def _split_by_codes(codes: np.ndarray, n_codes: int) -> List[np.ndarray]:
+        """
+        Positions of each code 0..n_codes-1, ascending within each code.
+        """
+        order = np.argsort(codes, kind='stable')
+        bounds = np.cumsum(np.bincount(codes, minlength=n_codes))[:-1]
+        return np.split(order, bounds)
 
-# from register_comparison.meta_data.schema import FeatureSchema
-# from register_comparison.comparators.comparator import Comparator
-# from aggregator import Aggregator
-# from register_comparison.extractors.extractor import FeatureExtractor
-# from register_comparison.aligners.aligner import Aligner
+    def _event_summary(self) -> Dict[str, np.ndarray]:
+        """
+        Distinct (newspaper, parse_type, feature_id, canonical_value, headline_value)
+        combinations with their value_pair and event counts, in order of first
+        appearance. Built in one pass over the events; every per-group count and
+        distribution is a projection of this table.
+        """
+        if 'summary' not in self._indices:
+            combined = np.zeros(len(self.global_events), dtype=np.int64)
+            widths = []
+            for key in SUMMARY_KEYS:
+                codes, values = self._factorized(key)
+                widths.append(max(len(values), 1))
+                combined = self._combine_codes(combined, codes, widths[-1])
+            row_codes, combos = pd.factorize(combined)
+            summary = {'count': np.bincount(row_codes, minlength=len(combos))}
+            for key, width in zip(reversed(SUMMARY_KEYS), reversed(widths)):
+                combos, summary[key] = np.divmod(combos, width)
+            summary['value_pair'] = self._factorized('value_pair')[0][self._first_positions(row_codes)]
+            self._indices['summary'] = summary
+        return self._indices['summary']
+
+    def _summary_rows(self, **group_codes) -> np.ndarray:
+        """
+        Mask of the summary rows in one group, given by codes (e.g. newspaper=0, parse_type=1).
+        """
+        summary = self._event_summary()
+        rows = np.ones(len(summary['count']), dtype=bool)
+        for key, code in group_codes.items():
+            rows &= summary[key] == code
+        return rows
 
-# Usage:
+    def _summary_counts(self, rows: np.ndarray, *keys: str) -> List[List[Any]]:
+        """
+        Distinct combinations of the given summary keys within the selected rows
+        and their event counts, in order of first appearance:
+        [values of key 1, ..., values of key k, counts].
+        """
+        summary = self._event_summary()
+        widths = [max(len(self._factorized(key)[1]), 1) for key in keys]
+        combined = np.zeros(int(rows.sum()), dtype=np.int64)
+        for key, width in zip(keys, widths):
+            combined = self._combine_codes(combined, summary[key][rows], width)
+        codes, combos = pd.factorize(combined)
+        counts = np.bincount(codes, weights=summary['count'][rows], minlength=len(combos))
+
+        columns = [counts.astype(np.int64).tolist()]
+        for key, width in zip(reversed(keys), reversed(widths)):
+            combos, key_codes = np.divmod(combos, width)
+            columns.insert(0, self._factorized(key)[1][key_codes].tolist())
+        return columns
+
+    def _summary_total(self, rows: np.ndarray) -> int:
+        """
+        Number of events in the selected summary rows.
+        """
+        return int(self._event_summary()['count'][rows].sum())
 
-# 1. Load schema
-# schema = FeatureSchema("data/diff-ontology-ver-3.0.json")
-# schema.load_schema()
-#
-# # 2. Prepare aligner and get pairs (example, one newspaper setup)
-# aligner = Aligner(
-#     texts_canonical=schema.canon_text_list,
-#     texts_headlines=head_text_list,
-#     deps_canonical=canon_dep_list,
-#     deps_headlines=head_dep_list,
-#     consts_canonical=canon_const_list,
-#     consts_headlines=head_const_list,
-#     newspaper_name="Times-of-India"
-# )
-#
-# pairs = aligner.align()
-#
-# # 3. Extract features
-# extractor = FeatureExtractor(schema)
-# comparator = Comparator(schema)
-# aggregators = Aggregator()
-#
-# for pair in pairs:
-#     features = extractor.extract_features(pair)
-#     events = comparator.compare_pair(pair, features)
-#     aggregators.add_events(events)
-#
-# # 4. Check counts
-# print("Global counts:", aggregators.global_counts())
-# print("Counts per newspaper:", aggregators.per_newspaper_counts())
-#
-# # 5. Convert to matrix for DataFrame/CSV
-# matrix = aggregators.to_matrix(aggregators.global_events)
+    def _value_pairs_in(self, rows: np.ndarray, group=None):
+        """
+        Feature × value_pair counts in the selected rows, memoized per named
+        event group (e.g. ('newspaper', name)) since several analyses count the same groups.
+        """
+        if group is None:
+            return self._summary_counts(rows, 'feature_id', 'value_pair')
+        if group not in self._value_pair_counts:
+            self._value_pair_counts[group] = self._summary_counts(rows, 'feature_id', 'value_pair')
+        return self._value_pair_counts[group]
+
+    @staticmethod
+    def _nest_counts(outer_values, inner_values, counts) -> Dict[str, Dict[str, int]]:
+        """
+        {outer value: {inner value: count}} from two-key _summary_counts output.
+        """
+        nested = {}
+        for outer_value, inner_value, count in zip(outer_values, inner_values, counts):
+            nested.setdefault(outer_value, {})[inner_value] = count
+        return nested
 
-# Version 2
+    def _feature_counts_in(self, rows: np.ndarray) -> Dict[str, int]:
+        """
+        feature_counts for the events in the selected summary rows.
+        """
+        return dict(zip(*self._summary_counts(rows, 'feature_id')))
 
-# from collections import defaultdict
-# from typing import List, Dict, Any
-from register_comparison.comparators.comparator import DifferenceEvent
+    def _group_indices(self, attr: str) -> Dict[str, np.ndarray]:
+        """
+        Positions in global_events for each value of an event attribute,
+        keyed in order of first appearance.
+        """
+        if attr not in self._indices:
+            codes, uniques = self._factorized(attr)
+            self._indices[attr] = dict(zip(uniques, self._split_by_codes(codes, len(uniques))))
+        return self._indices[attr]
 
-class Aggregator:
-    """
-    Aggregates DifferenceEvent records into summary counts and matrices
-    for later statistical analysis and reporting.
-    """
+    def _grouped_events(self, attr: str) -> Dict[str, List[DifferenceEvent]]:
+        """
+        Events grouped by an attribute, materialized once per batch of additions.
+        """
+        if attr not in self._groups:
+            events = self.global_events
+            self._groups[attr] = {
+                key: [events[i] for i in idx.tolist()]
+                for key, idx in self._group_indices(attr).items()
+            }
+        return self._groups[attr]
 
-    def __init__(self):
-        # Stores aggregated data
-        self.by_newspaper: Dict[str, List[DifferenceEvent]] = defaultdict(list)
-        self.by_parse_type: Dict[str, List[DifferenceEvent]] = defaultdict(list)
-        self.global_events: List[DifferenceEvent] = []
+    @property
+    def by_newspaper(self) -> Dict[str, List[DifferenceEvent]]:
+        """
+        Events grouped by newspaper.
+        """
+        return self._grouped_events('newspaper')
 
-    def add_events(self, events: List[DifferenceEvent]):
+    @property
+    def by_parse_type(self) -> Dict[str, List[DifferenceEvent]]:
         """
-        Add a list of DifferenceEvent objects to the aggregator.
+        Events grouped by parse type (dep/const).
         """
-        for ev in events:
-            self.by_newspaper[ev.newspaper].append(ev)
-            self.by_parse_type[ev.parse_type].append(ev)
-            self.global_events.append(ev)
+        return self._grouped_events('parse_type')
 
     def feature_counts(self, events: List[DifferenceEvent]) -> Dict[str, int]:
         """
         Count how many times each feature appears in a given list of events.
         """
-        counts = defaultdict(int)
-        for ev in events:
-            counts[ev.feature_id] += 1
-        return dict(counts)
+        # For an arbitrary list, reading the attribute dominates; Counter's C loop
+        # beats factorizing at every size (the aggregator's own groups use cached codes)
+        return dict(Counter(map(_feature_id, events)))
 
     def per_newspaper_counts(self) -> Dict[str, Dict[str, int]]:
         """
         Get feature frequency counts for each newspaper.
         """
-        result = {}
-        for newspaper, evs in self.by_newspaper.items():
-            result[newspaper] = self.feature_counts(evs)
-        return result
+        return {newspaper: self._feature_counts_in(self._summary_rows(newspaper=i))
+                for i, newspaper in enumerate(self._factorized('newspaper')[1])}
 
     def per_parse_type_counts(self) -> Dict[str, Dict[str, int]]:
         """
         Get feature frequency counts for each parse type (dep/const).
         """
-        result = {}
-        for ptype, evs in self.by_parse_type.items():
-            result[ptype] = self.feature_counts(evs)
-        return result
+        return {ptype: self._feature_counts_in(self._summary_rows(parse_type=j))
+                for j, ptype in enumerate(self._factorized('parse_type')[1])}
 
     def global_counts(self) -> Dict[str, int]:
         """
         Get feature frequency counts across all events.
         """
-        return self.feature_counts(self.global_events)
+        return self._feature_counts_in(self._summary_rows())
+
+    def iter_matrix(self, events: Iterable[DifferenceEvent]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one dict per event for CSV/DF creation, without holding them all.
+        """
+        return (ev.to_dict() for ev in events)
 
     def to_matrix(self, events: List[DifferenceEvent]) -> List[Dict[str, Any]]:
         """
         Convert events into a list of dicts for CSV/DF creation.
         """
-        return [ev.to_dict() for ev in events]
+        return list(self.iter_matrix(events))
 
     def to_stats_runner_format(self) -> List[Dict[str, Any]]:
         """
@@ -179,41 +315,28 @@ class Aggregator:
         Creates proper contingency table data comparing canonical vs headline register usage.
         Returns data in format: feature_id, count_a, total_a, count_b, total_b
         """
-        # Count total contexts (unique sentence pairs)
-        contexts = set()
-        for event in self.global_events:
-            contexts.add(f"{event.newspaper}_{event.sent_id}")
-
+        # Count total contexts (unique newspaper, sentence pairs)
+        newspaper_codes = self._factorized('newspaper')[0]
+        sent_codes, sent_ids = self._factorized('sent_id')
+        context_codes, contexts = pd.factorize(
+            self._combine_codes(newspaper_codes, sent_codes, max(len(sent_ids), 1)))
         total_contexts = len(contexts)
 
-        # Count feature occurrences per context for each register
-        canonical_feature_contexts = {}  # feature_id -> set of contexts where it appears in canonical
-        headline_feature_contexts = {}   # feature_id -> set of contexts where it appears in headline
-
-        for event in self.global_events:
-            context_id = f"{event.newspaper}_{event.sent_id}"
-            feature_id = event.feature_id
+        # Count distinct contexts per feature for each register
+        feature_codes, feature_ids = self._factorized('feature_id')
 
-            # Initialize if needed
-            if feature_id not in canonical_feature_contexts:
-                canonical_feature_contexts[feature_id] = set()
-            if feature_id not in headline_feature_contexts:
-                headline_feature_contexts[feature_id] = set()
+        def contexts_per_feature(mask: np.ndarray) -> List[int]:
+            width = max(total_contexts, 1)
+            feature_contexts = pd.unique(self._combine_codes(feature_codes[mask], context_codes[mask], width))
+            return np.bincount(feature_contexts // width, minlength=len(feature_ids)).tolist()
 
-            # Determine which register(s) this feature applies to based on values
-            if event.canonical_value and event.canonical_value != "ABSENT":
-                canonical_feature_contexts[feature_id].add(context_id)
-            if event.headline_value and event.headline_value != "ABSENT":
-                headline_feature_contexts[feature_id].add(context_id)
+        # A register counts for a context where the feature's value there is set (not empty/ABSENT)
+        canonical_counts = contexts_per_feature(self._present_mask('canonical_value'))
+        headline_counts = contexts_per_feature(self._present_mask('headline_value'))
 
         # Convert to StatsRunner format
         stats_data = []
-        all_features = set(canonical_feature_contexts.keys()) | set(headline_feature_contexts.keys())
-
-        for feature_id in all_features:
-            canonical_count = len(canonical_feature_contexts.get(feature_id, set()))
-            headline_count = len(headline_feature_contexts.get(feature_id, set()))
-
+        for feature_id, canonical_count, headline_count in zip(feature_ids.tolist(), canonical_counts, headline_counts):
             stats_data.append({
                 "feature_id": feature_id,
                 "count_a": canonical_count,      # contexts where feature appears in canonical
@@ -224,6 +347,15 @@ class Aggregator:
 
         return stats_data
 
+    def _present_mask(self, column: str) -> np.ndarray:
+        """
+        True for events whose value in a register column is set (non-empty, not ABSENT).
+        """
+        codes, values = self._factorized(column)
+        present = np.fromiter((bool(value) and value != "ABSENT" for value in values),
+                              dtype=bool, count=len(values))
+        return present[codes]
+
     def get_comprehensive_analysis(self) -> Dict[str, Any]:
         """
         Get comprehensive multi-dimensional analysis of all events.
@@ -239,60 +371,54 @@ class Aggregator:
             'cross_analysis': {}
         }
 
+        newspapers = self._factorized('newspaper')[1]
+        parse_types = self._factorized('parse_type')[1]
+
         # Per-newspaper analysis
-        for newspaper, events in self.by_newspaper.items():
+        for i, newspaper in enumerate(newspapers):
+            rows = self._summary_rows(newspaper=i)
             analysis['by_newspaper'][newspaper] = {
-                'total_events': len(events),
-                'feature_counts': self.feature_counts(events),
-                'parse_type_breakdown': self._get_parse_type_breakdown_for_events(events),
-                'feature_value_pairs': self._get_feature_value_pairs(events)
+                'total_events': self._summary_total(rows),
+                'feature_counts': self._feature_counts_in(rows),
+                'parse_type_breakdown': self._get_parse_type_breakdown_for_events(rows),
+                'feature_value_pairs': self._get_feature_value_pairs(rows, ('newspaper', newspaper))
             }
 
         # Per-parse-type analysis
-        for parse_type, events in self.by_parse_type.items():
+        for j, parse_type in enumerate(parse_types):
+            rows = self._summary_rows(parse_type=j)
             analysis['by_parse_type'][parse_type] = {
-                'total_events': len(events),
-                'feature_counts': self.feature_counts(events),
-                'newspaper_breakdown': self._get_newspaper_breakdown_for_events(events),
-                'feature_value_pairs': self._get_feature_value_pairs(events)
+                'total_events': self._summary_total(rows),
+                'feature_counts': self._feature_counts_in(rows),
+                'newspaper_breakdown': self._get_newspaper_breakdown_for_events(rows),
+                'feature_value_pairs': self._get_feature_value_pairs(rows, ('parse_type', parse_type))
             }
 
         # Cross-analysis: newspaper × parse_type combinations
-        for newspaper in self.by_newspaper.keys():
-            for parse_type in self.by_parse_type.keys():
+        for i, newspaper in enumerate(newspapers):
+            for j, parse_type in enumerate(parse_types):
                 key = f"{newspaper}_{parse_type}"
-                filtered_events = [ev for ev in self.global_events
-                                 if ev.newspaper == newspaper and ev.parse_type == parse_type]
+                rows = self._summary_rows(newspaper=i, parse_type=j)
 
                 analysis['cross_analysis'][key] = {
-                    'total_events': len(filtered_events),
-                    'feature_counts': self.feature_counts(filtered_events),
-                    'feature_value_pairs': self._get_feature_value_pairs(filtered_events)
+                    'total_events': self._summary_total(rows),
+                    'feature_counts': self._feature_counts_in(rows),
+                    'feature_value_pairs': self._get_feature_value_pairs(rows, ('cross', newspaper, parse_type))
                 }
 
         return analysis
 
-    def _get_parse_type_breakdown_for_events(self, events: List[DifferenceEvent]) -> Dict[str, Dict[str, int]]:
-        """Get parse type breakdown for a given set of events."""
-        breakdown = defaultdict(lambda: defaultdict(int))
-        for event in events:
-            breakdown[event.parse_type][event.feature_id] += 1
-        return dict(breakdown)
-
-    def _get_newspaper_breakdown_for_events(self, events: List[DifferenceEvent]) -> Dict[str, Dict[str, int]]:
-        """Get newspaper breakdown for a given set of events."""
-        breakdown = defaultdict(lambda: defaultdict(int))
-        for event in events:
-            breakdown[event.newspaper][event.feature_id] += 1
-        return dict(breakdown)
-
-    def _get_feature_value_pairs(self, events: List[DifferenceEvent]) -> Dict[str, Dict[str, int]]:
-        """Get canonical→headline value pair frequencies for features."""
-        pairs = defaultdict(lambda: defaultdict(int))
-        for event in events:
-            pair_key = f"{event.canonical_value}→{event.headline_value}"
-            pairs[event.feature_id][pair_key] += 1
-        return dict(pairs)
+    def _get_parse_type_breakdown_for_events(self, rows: np.ndarray) -> Dict[str, Dict[str, int]]:
+        """Get parse type breakdown for the events in the selected summary rows."""
+        return self._nest_counts(*self._summary_counts(rows, 'parse_type', 'feature_id'))
+
+    def _get_newspaper_breakdown_for_events(self, rows: np.ndarray) -> Dict[str, Dict[str, int]]:
+        """Get newspaper breakdown for the events in the selected summary rows."""
+        return self._nest_counts(*self._summary_counts(rows, 'newspaper', 'feature_id'))
+
+    def _get_feature_value_pairs(self, rows: np.ndarray, group=None) -> Dict[str, Dict[str, int]]:
+        """Get canonical→headline value pair frequencies for features in the selected summary rows."""
+        return self._nest_counts(*self._value_pairs_in(rows, group))
 
     def get_feature_value_analysis(self) -> Dict[str, Any]:
         """
@@ -309,36 +435,84 @@ class Aggregator:
         }
 
         # Global feature-value analysis
-        global_pairs = self._get_feature_value_pairs(self.global_events)
+        newspapers = self._factorized('newspaper')[1]
+        parse_types = self._factorized('parse_type')[1]
+
+        global_pairs = self._get_feature_value_pairs(self._summary_rows(), ('global',))
         analysis['global_feature_values'] = global_pairs
 
         # By newspaper feature-value analysis
-        for newspaper in self.by_newspaper.keys():
-            newspaper_pairs = self._get_feature_value_pairs(self.by_newspaper[newspaper])
+        for i, newspaper in enumerate(newspapers):
+            newspaper_pairs = self._get_feature_value_pairs(self._summary_rows(newspaper=i), ('newspaper', newspaper))
             analysis['by_newspaper_feature_values'][newspaper] = newspaper_pairs
 
         # By parse type feature-value analysis
-        for parse_type in self.by_parse_type.keys():
-            parse_type_pairs = self._get_feature_value_pairs(self.by_parse_type[parse_type])
+        for j, parse_type in enumerate(parse_types):
+            parse_type_pairs = self._get_feature_value_pairs(self._summary_rows(parse_type=j), ('parse_type', parse_type))
             analysis['by_parse_type_feature_values'][parse_type] = parse_type_pairs
 
         # Cross-dimensional feature-value analysis (consistent with comprehensive analysis)
-        for newspaper in self.by_newspaper.keys():
-            for parse_type in self.by_parse_type.keys():
+        for i, newspaper in enumerate(newspapers):
+            for j, parse_type in enumerate(parse_types):
                 key = f"{newspaper}_{parse_type}"
-                filtered_events = [ev for ev in self.global_events
-                                 if ev.newspaper == newspaper and ev.parse_type == parse_type]
-                combo_pairs = self._get_feature_value_pairs(filtered_events)
+                combo_pairs = self._get_feature_value_pairs(self._summary_rows(newspaper=i, parse_type=j),
+                                                            ('cross', newspaper, parse_type))
                 analysis['cross_feature_values'][key] = combo_pairs
 
         # Transformation pattern analysis
         analysis['transformation_patterns'] = self._analyze_transformation_patterns(global_pairs)
 
         # Value-level statistics
-        analysis['value_statistics'] = self._get_value_level_statistics(global_pairs)
+        analysis['value_statistics'] = self._get_value_level_statistics(global_pairs, self._summary_rows())
 
         return analysis
 
+    def _value_pair_transformation_types(self) -> Dict[str, str]:
+        """
+        Transformation type of each distinct canonical→headline pair, classified
+        once per key from its split string halves (so 1 and '1' compare equal).
+        """
+        if not self._value_pair_types:
+            pair_keys = self._factorized('value_pair')[1]
+            canonical, headline = self._split_value_pairs()
+
+            deletions = headline == 'ABSENT'                                        # canonical→ABSENT
+            additions = ~deletions & (canonical == 'ABSENT')                        # ABSENT→headline
+            null_changes = ~deletions & ~additions & (canonical == headline)        # same→same
+            types = np.select([deletions, additions, null_changes],
+                              ['deletions', 'additions', 'null_changes'], default='changes')
+            self._value_pair_types.update(zip(pair_keys.tolist(), types.tolist()))
+        return self._value_pair_types
+
+    def _split_value_pairs(self):
+        """
+        Canonical and headline halves (strings) of each distinct
+        canonical→headline key, indexed by value_pair code; each key is split once.
+        """
+        if 'value_pair_parts' not in self._codes:
+            halves = [pair_key.split('→', 1) for pair_key in self._factorized('value_pair')[1].tolist()]
+            self._codes['value_pair_parts'] = tuple(
+                np.fromiter((parts[side] for parts in halves), dtype=object, count=len(halves))
+                for side in (0, 1))
+        return self._codes['value_pair_parts']
+
+    def _value_diversity(self, rows: np.ndarray) -> List[Dict[str, int]]:
+        """
+        Number of distinct canonical and headline values among the value pairs
+        of each feature in the selected summary rows: [canonical, headline].
+        """
+        summary = self._event_summary()
+        feature_codes, pair_codes = summary['feature_id'][rows], summary['value_pair'][rows]
+        feature_ids = self._factorized('feature_id')[1]
+        diversity = []
+        for halves in self._split_value_pairs():
+            part_codes = pd.factorize(halves)[0]
+            width = max(len(part_codes), 1)
+            feature_parts = pd.unique(self._combine_codes(feature_codes, part_codes[pair_codes], width))
+            diversity.append(dict(zip(feature_ids.tolist(),
+                                      np.bincount(feature_parts // width, minlength=len(feature_ids)).tolist())))
+        return diversity
+
     def _analyze_transformation_patterns(self, feature_value_pairs: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
         """Analyze common transformation patterns across features."""
         patterns = {
@@ -352,42 +526,32 @@ class Aggregator:
             'bidirectional_changes': {}
         }
 
+        pair_types = self._value_pair_transformation_types()
+        transformation_types = patterns['transformation_types']
+
         for feature_id, pairs in feature_value_pairs.items():
             # Sort by frequency
             sorted_pairs = sorted(pairs.items(), key=lambda x: x[1], reverse=True)
             patterns['most_common_transformations'][feature_id] = sorted_pairs[:10]
 
-            # Categorize transformation types
+            # Categorize transformation types (classified once per distinct pair)
             for pair_key, count in pairs.items():
-                canonical_val, headline_val = pair_key.split('→', 1)
-
-                if headline_val == 'ABSENT':
-                    patterns['transformation_types']['deletions'][pair_key] = count
-                elif canonical_val == 'ABSENT':
-                    patterns['transformation_types']['additions'][pair_key] = count
-                elif canonical_val == headline_val:
-                    patterns['transformation_types']['null_changes'][pair_key] = count
-                else:
-                    patterns['transformation_types']['changes'][pair_key] = count
+                transformation_types[pair_types[pair_key]][pair_key] = count
 
         return patterns
 
-    def _get_value_level_statistics(self, feature_value_pairs: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
-        """Get statistical summaries at the value level."""
+    def _get_value_level_statistics(self, feature_value_pairs: Dict[str, Dict[str, int]],
+                                    rows: np.ndarray) -> Dict[str, Any]:
+        """Get statistical summaries at the value level (pairs counted from the selected summary rows)."""
         stats = {}
 
+        # Value diversity metrics, for every feature at once
+        canonical_diversity, headline_diversity = self._value_diversity(rows)
+
         for feature_id, pairs in feature_value_pairs.items():
             total_transformations = sum(pairs.values())
             unique_transformations = len(pairs)
 
-            # Value diversity metrics
-            canonical_values = set()
-            headline_values = set()
-            for pair_key in pairs.keys():
-                canonical_val, headline_val = pair_key.split('→', 1)
-                canonical_values.add(canonical_val)
-                headline_values.add(headline_val)
-
             # Transformation concentration (top 3 pairs)
             sorted_pairs = sorted(pairs.items(), key=lambda x: x[1], reverse=True)
             top3_concentration = sum(count for _, count in sorted_pairs[:3]) / total_transformations if total_transformations > 0 else 0
@@ -395,29 +559,22 @@ class Aggregator:
             stats[feature_id] = {
                 'total_transformations': total_transformations,
                 'unique_transformation_types': unique_transformations,
-                'canonical_value_diversity': len(canonical_values),
-                'headline_value_diversity': len(headline_values),
+                'canonical_value_diversity': canonical_diversity[feature_id],
+                'headline_value_diversity': headline_diversity[feature_id],
                 'top3_concentration_ratio': top3_concentration,
                 'most_frequent_transformation': sorted_pairs[0] if sorted_pairs else None,
-                'transformation_entropy': self._calculate_entropy(list(pairs.values())) if pairs else 0
+                'transformation_entropy': self._calculate_entropy(np.fromiter(pairs.values(), dtype=np.int64, count=len(pairs))) if pairs else 0
             }
 
         return stats
 
-    def _calculate_entropy(self, counts: List[int]) -> float:
+    def _calculate_entropy(self, counts: np.ndarray) -> float:
         """Calculate Shannon entropy for transformation distribution."""
-        import math
-        total = sum(counts)
-        if total == 0:
+        counts = np.asarray(counts, dtype=np.int64)
+        if counts.sum() == 0:
             return 0
 
-        entropy = 0
-        for count in counts:
-            if count > 0:
-                p = count / total
-                entropy -= p * math.log2(p)
-
-        return entropy
+        return float(_entropy_bits(counts))
 
     def get_feature_value_pair_analysis(self) -> Dict[str, Any]:
         """
@@ -435,27 +592,29 @@ class Aggregator:
         }
 
         # Global feature-value pair analysis
-        global_pair_units = self._get_feature_value_pair_units(self.global_events)
+        newspapers = self._factorized('newspaper')[1]
+        parse_types = self._factorized('parse_type')[1]
+
+        global_pair_units = self._get_feature_value_pair_units(self._summary_rows(), ('global',))
         analysis['global_feature_value_pairs'] = global_pair_units
 
         # By newspaper feature-value pair analysis
-        for newspaper in self.by_newspaper.keys():
-            newspaper_pairs = self._get_feature_value_pair_units(self.by_newspaper[newspaper])
+        for i, newspaper in enumerate(newspapers):
+            newspaper_pairs = self._get_feature_value_pair_units(self._summary_rows(newspaper=i), ('newspaper', newspaper))
             analysis['by_newspaper_feature_value_pairs'][newspaper] = newspaper_pairs
 
         # By parse type feature-value pair analysis
-        for parse_type in self.by_parse_type.keys():
-            parse_type_pairs = self._get_feature_value_pair_units(self.by_parse_type[parse_type])
+        for j, parse_type in enumerate(parse_types):
+            parse_type_pairs = self._get_feature_value_pair_units(self._summary_rows(parse_type=j), ('parse_type', parse_type))
             analysis['by_parse_type_feature_value_pairs'][parse_type] = parse_type_pairs
 
         # Cross-dimensional analysis
-        for newspaper in self.by_newspaper.keys():
-            for parse_type in self.by_parse_type.keys():
+        for i, newspaper in enumerate(newspapers):
+            for j, parse_type in enumerate(parse_types):
                 cross_key = f"{newspaper}_{parse_type}"
-                cross_events = [e for e in self.global_events
-                               if e.newspaper == newspaper and e.parse_type == parse_type]
-                if cross_events:
-                    cross_pairs = self._get_feature_value_pair_units(cross_events)
+                cross_rows = self._summary_rows(newspaper=i, parse_type=j)
+                if cross_rows.any():
+                    cross_pairs = self._get_feature_value_pair_units(cross_rows, ('cross', newspaper, parse_type))
                     analysis['cross_feature_value_pairs'][cross_key] = cross_pairs
 
         # Calculate pair statistics
@@ -469,19 +628,14 @@ class Aggregator:
 
         return analysis
 
-    def _get_feature_value_pair_units(self, events: List[DifferenceEvent]) -> Dict[str, int]:
+    def _get_feature_value_pair_units(self, rows: np.ndarray, group=None) -> Dict[str, int]:
         """
-        Get feature-value pairs treated as single atomic units.
+        Get feature-value pairs treated as single atomic units for the events in the selected summary rows.
         Returns: {feature_canonical_value→headline_value: count}
         """
-        pair_units = {}
-
-        for event in events:
-            # Create atomic feature-value pair identifier
-            pair_key = f"{event.feature_id}:{event.canonical_value}→{event.headline_value}"
-            pair_units[pair_key] = pair_units.get(pair_key, 0) + 1
-
-        return pair_units
+        features, value_pairs, counts = self._value_pairs_in(rows, group)
+        return {f"{feature}:{value_pair}": count
+                for feature, value_pair, count in zip(features, value_pairs, counts)}
 
     def _calculate_pair_statistics(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate comprehensive statistics for feature-value pairs."""
@@ -532,7 +686,7 @@ class Aggregator:
             diversity['newspaper_pair_diversity'][newspaper] = {
                 'unique_pairs': len(pairs),
                 'total_occurrences': sum(pairs.values()) if pairs else 0,
-                'diversity_index': self._calculate_diversity_index(list(pairs.values())) if pairs else 0
+                'diversity_index': self._calculate_diversity_index(np.fromiter(pairs.values(), dtype=np.int64, count=len(pairs))) if pairs else 0
             }
 
         # Parse type diversity
@@ -540,7 +694,7 @@ class Aggregator:
             diversity['parse_type_pair_diversity'][parse_type] = {
                 'unique_pairs': len(pairs),
                 'total_occurrences': sum(pairs.values()) if pairs else 0,
-                'diversity_index': self._calculate_diversity_index(list(pairs.values())) if pairs else 0
+                'diversity_index': self._calculate_diversity_index(np.fromiter(pairs.values(), dtype=np.int64, count=len(pairs))) if pairs else 0
             }
 
         return diversity
@@ -560,7 +714,6 @@ class Aggregator:
         for pair_key, count in global_pairs.items():
             if ':' in pair_key and '→' in pair_key:
                 feature_part, transformation = pair_key.split(':', 1)
-                canonical_val, headline_val = transformation.split('→', 1)
 
                 # Count transformations per feature
                 if feature_part not in patterns['feature_transformation_counts']:
@@ -578,17 +731,13 @@ class Aggregator:
 
         return patterns
 
-    def _calculate_diversity_index(self, frequencies: List[int]) -> float:
-        """Calculate Shannon diversity index for frequency distribution."""
-        if not frequencies or sum(frequencies) == 0:
+    def _calculate_diversity_index(self, frequencies: np.ndarray) -> float:
+        """Calculate Shannon diversity index (natural log) for frequency distribution."""
+        frequencies = np.asarray(frequencies, dtype=np.int64)
+        if frequencies.sum() == 0:
             return 0.0
 
-        total = sum(frequencies)
-        proportions = [f / total for f in frequencies if f > 0]
-
-        import math
-        diversity = -sum(p * math.log(p) for p in proportions)
-        return diversity
+        return float(_entropy_bits(frequencies) * math.log(2))
 
     def get_bidirectional_cross_entropy_analysis(self) -> Dict[str, Any]:
         """
@@ -605,29 +754,26 @@ class Aggregator:
         }
 
         # Global bidirectional cross-entropy
-        global_ce = self._calculate_bidirectional_cross_entropy(self.global_events)
+        global_ce = self._calculate_bidirectional_cross_entropy()
         analysis['global_cross_entropy'] = global_ce
 
         # By newspaper cross-entropy
-        for newspaper in self.by_newspaper.keys():
-            newspaper_events = self.by_newspaper[newspaper]
-            newspaper_ce = self._calculate_bidirectional_cross_entropy(newspaper_events)
+        for i, newspaper in enumerate(self._factorized('newspaper')[1]):
+            newspaper_ce = self._calculate_bidirectional_cross_entropy(self._summary_rows(newspaper=i))
             analysis['by_newspaper_cross_entropy'][newspaper] = newspaper_ce
 
         # By parse type cross-entropy
-        for parse_type in self.by_parse_type.keys():
-            parse_type_events = self.by_parse_type[parse_type]
-            parse_type_ce = self._calculate_bidirectional_cross_entropy(parse_type_events)
+        for j, parse_type in enumerate(self._factorized('parse_type')[1]):
+            parse_type_ce = self._calculate_bidirectional_cross_entropy(self._summary_rows(parse_type=j))
             analysis['by_parse_type_cross_entropy'][parse_type] = parse_type_ce
 
         # Cross-dimensional analysis
-        for newspaper in self.by_newspaper.keys():
-            for parse_type in self.by_parse_type.keys():
+        for i, newspaper in enumerate(self._factorized('newspaper')[1]):
+            for j, parse_type in enumerate(self._factorized('parse_type')[1]):
                 cross_key = f"{newspaper}_{parse_type}"
-                cross_events = [e for e in self.global_events
-                               if e.newspaper == newspaper and e.parse_type == parse_type]
-                if cross_events:
-                    cross_ce = self._calculate_bidirectional_cross_entropy(cross_events)
+                rows = self._summary_rows(newspaper=i, parse_type=j)
+                if rows.any():
+                    cross_ce = self._calculate_bidirectional_cross_entropy(rows)
                     analysis['cross_dimensional_cross_entropy'][cross_key] = cross_ce
 
         # Feature-level cross-entropy analysis
@@ -638,103 +784,123 @@ class Aggregator:
 
         return analysis
 
-    def _calculate_bidirectional_cross_entropy(self, events: List[DifferenceEvent]) -> Dict[str, Any]:
+    def _register_value_codes(self):
+        """
+        Maps from canonical and headline value codes into one shared code space,
+        so both registers' value counts line up index by index.
+        """
+        if 'register_value' not in self._codes:
+            canonical_values = self._factorized('canonical_value')[1]
+            headline_values = self._factorized('headline_value')[1]
+            shared_codes, shared_values = self._factorize(np.concatenate([canonical_values, headline_values]))
+            self._codes['register_value'] = (shared_codes[:len(canonical_values)],
+                                             shared_codes[len(canonical_values):],
+                                             len(shared_values))
+        return self._codes['register_value']
+
+    def _calculate_bidirectional_cross_entropy(self, rows: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
-        Calculate bidirectional cross-entropy for a set of events.
+        Calculate bidirectional cross-entropy for the events in the selected
+        event summary rows (all events when omitted).
         Returns cross-entropy in both directions and combined measures.
         """
-        import math
-        from collections import defaultdict
-
-        # Separate events by feature for more granular analysis
-        feature_events = defaultdict(list)
-        for event in events:
-            feature_events[event.feature_id].append(event)
-
-        # Calculate distributions for canonical and headline registers
-        canonical_dist = defaultdict(int)
-        headline_dist = defaultdict(int)
-        total_canonical = 0
-        total_headline = 0
-
-        # Count value occurrences in each register
-        for event in events:
-            canonical_dist[event.canonical_value] += 1
-            headline_dist[event.headline_value] += 1
-            total_canonical += 1
-            total_headline += 1
-
-        # Convert to probabilities
-        canonical_probs = {val: count/total_canonical for val, count in canonical_dist.items()}
-        headline_probs = {val: count/total_headline for val, count in headline_dist.items()}
+        if rows is None:
+            rows = slice(None)
+        n_rows = len(self._event_summary()['count'][rows])
+        return self._grouped_cross_entropy(rows, np.zeros(n_rows, dtype=np.int64), 1)[0]
 
-        # Get all unique values
-        all_values = set(canonical_dist.keys()) | set(headline_dist.keys())
+    def _grouped_cross_entropy(self, rows, group_codes: np.ndarray, n_groups: int) -> List[Dict[str, Any]]:
+        """
+        Bidirectional cross-entropy measures for several event groups at once,
+        given the selected summary rows and a group code for each of them.
+        Every per-group sum is one bincount over the (group, value) cells.
+        """
+        summary = self._event_summary()
+        canonical_map, headline_map, n_values = self._register_value_codes()
+        weights = summary['count'][rows]
+        group_codes = np.asarray(group_codes, dtype=np.int64)
+        totals = np.bincount(group_codes, weights=weights, minlength=n_groups).astype(np.int64)
+
+        # Count value occurrences in each register per (group, shared value) cell
+        width = max(n_values, 1)
+        canonical_cells = group_codes * width + canonical_map[summary['canonical_value'][rows]]
+        headline_cells = group_codes * width + headline_map[summary['headline_value'][rows]]
+        cells, cell_codes = np.unique(np.concatenate([canonical_cells, headline_cells]), return_inverse=True)
+        canonical_counts = np.bincount(cell_codes[:len(canonical_cells)], weights=weights, minlength=len(cells))
+        headline_counts = np.bincount(cell_codes[len(canonical_cells):], weights=weights, minlength=len(cells))
+        cell_groups = cells // width
+        in_canonical = canonical_counts > 0
+        in_headline = headline_counts > 0
+
+        def per_group(values: np.ndarray) -> List[float]:
+            return np.bincount(cell_groups, weights=values, minlength=n_groups).tolist()
+
+        # Convert to probabilities, with a small epsilon for values unseen in one register
+        cell_totals = totals[cell_groups]
+        canonical_probs = canonical_counts / cell_totals
+        headline_probs = headline_counts / cell_totals
+        p_canonical = np.where(in_canonical, canonical_probs, 1e-10)
+        p_headline = np.where(in_headline, headline_probs, 1e-10)
 
-        # Calculate cross-entropies
         # H(canonical, headline) = -sum(p_canonical(x) * log(p_headline(x)))
-        canonical_to_headline_ce = 0
-        headline_to_canonical_ce = 0
-
-        for value in all_values:
-            p_canonical = canonical_probs.get(value, 1e-10)  # Small epsilon for unseen values
-            p_headline = headline_probs.get(value, 1e-10)
-
-            # Cross-entropy: canonical → headline
-            if p_canonical > 0 and p_headline > 0:
-                canonical_to_headline_ce += -p_canonical * math.log2(p_headline)
-
-            # Cross-entropy: headline → canonical
-            if p_headline > 0 and p_canonical > 0:
-                headline_to_canonical_ce += -p_headline * math.log2(p_canonical)
-
-        # Calculate entropy of each register
-        canonical_entropy = -sum(p * math.log2(p) for p in canonical_probs.values() if p > 0)
-        headline_entropy = -sum(p * math.log2(p) for p in headline_probs.values() if p > 0)
-
-        # Calculate KL divergences
-        kl_canonical_to_headline = canonical_to_headline_ce - canonical_entropy
-        kl_headline_to_canonical = headline_to_canonical_ce - headline_entropy
-
-        # Combined measures
-        bidirectional_sum = canonical_to_headline_ce + headline_to_canonical_ce
-        kl_divergence_sum = kl_canonical_to_headline + kl_headline_to_canonical
-        jensen_shannon_divergence = 0.5 * kl_canonical_to_headline + 0.5 * kl_headline_to_canonical
-
-        return {
-            'canonical_to_headline_cross_entropy': canonical_to_headline_ce,
-            'headline_to_canonical_cross_entropy': headline_to_canonical_ce,
-            'bidirectional_cross_entropy_sum': bidirectional_sum,
-            'canonical_entropy': canonical_entropy,
-            'headline_entropy': headline_entropy,
-            'kl_canonical_to_headline': kl_canonical_to_headline,
-            'kl_headline_to_canonical': kl_headline_to_canonical,
-            'kl_divergence_sum': kl_divergence_sum,
-            'jensen_shannon_divergence': jensen_shannon_divergence,
-            'total_events': len(events),
-            'unique_canonical_values': len(canonical_dist),
-            'unique_headline_values': len(headline_dist),
-            'unique_combined_values': len(all_values),
-            'register_overlap_ratio': len(set(canonical_dist.keys()) & set(headline_dist.keys())) / len(all_values) if all_values else 0
-        }
+        canonical_to_headline = per_group(-p_canonical * np.log2(p_headline))
+        headline_to_canonical = per_group(-p_headline * np.log2(p_canonical))
+        # Entropy of each register (unseen values carry zero probability)
+        canonical_entropies = per_group(canonical_probs * np.log2(p_canonical))
+        headline_entropies = per_group(headline_probs * np.log2(p_headline))
+
+        unique_canonical = np.bincount(cell_groups[in_canonical], minlength=n_groups).tolist()
+        unique_headline = np.bincount(cell_groups[in_headline], minlength=n_groups).tolist()
+        unique_combined = np.bincount(cell_groups, minlength=n_groups).tolist()
+        shared = np.bincount(cell_groups[in_canonical & in_headline], minlength=n_groups).tolist()
+
+        results = []
+        for g in range(n_groups):
+            n_combined = unique_combined[g]
+            if n_combined:
+                canonical_to_headline_ce = canonical_to_headline[g]
+                headline_to_canonical_ce = headline_to_canonical[g]
+                canonical_entropy = -canonical_entropies[g]
+                headline_entropy = -headline_entropies[g]
+            else:
+                canonical_to_headline_ce = headline_to_canonical_ce = 0
+                canonical_entropy = headline_entropy = 0
+
+            # Calculate KL divergences
+            kl_canonical_to_headline = canonical_to_headline_ce - canonical_entropy
+            kl_headline_to_canonical = headline_to_canonical_ce - headline_entropy
+
+            # Combined measures
+            bidirectional_sum = canonical_to_headline_ce + headline_to_canonical_ce
+            kl_divergence_sum = kl_canonical_to_headline + kl_headline_to_canonical
+            jensen_shannon_divergence = 0.5 * kl_canonical_to_headline + 0.5 * kl_headline_to_canonical
+
+            results.append({
+                'canonical_to_headline_cross_entropy': canonical_to_headline_ce,
+                'headline_to_canonical_cross_entropy': headline_to_canonical_ce,
+                'bidirectional_cross_entropy_sum': bidirectional_sum,
+                'canonical_entropy': canonical_entropy,
+                'headline_entropy': headline_entropy,
+                'kl_canonical_to_headline': kl_canonical_to_headline,
+                'kl_headline_to_canonical': kl_headline_to_canonical,
+                'kl_divergence_sum': kl_divergence_sum,
+                'jensen_shannon_divergence': jensen_shannon_divergence,
+                'total_events': int(totals[g]),
+                'unique_canonical_values': unique_canonical[g],
+                'unique_headline_values': unique_headline[g],
+                'unique_combined_values': n_combined,
+                'register_overlap_ratio': shared[g] / n_combined if n_combined else 0
+            })
+        return results
 
     def _calculate_feature_level_cross_entropy(self) -> Dict[str, Dict[str, Any]]:
         """Calculate cross-entropy analysis for each feature separately."""
-        feature_analysis = {}
+        feature_ids = self._factorized('feature_id')[1]
 
-        # Group events by feature
-        from collections import defaultdict
-        feature_events = defaultdict(list)
-        for event in self.global_events:
-            feature_events[event.feature_id].append(event)
-
-        # Calculate cross-entropy for each feature
-        for feature_id, events in feature_events.items():
-            if len(events) >= 2:  # Need minimum events for meaningful analysis
-                feature_ce = self._calculate_bidirectional_cross_entropy(events)
-                feature_analysis[feature_id] = feature_ce
-
-        return feature_analysis
+        # Calculate cross-entropy for every feature in one batch
+        feature_ces = self._grouped_cross_entropy(slice(None), self._event_summary()['feature_id'], len(feature_ids))
+        return {feature_id: feature_ce for feature_id, feature_ce in zip(feature_ids, feature_ces)
+                if feature_ce['total_events'] >= 2}  # Need minimum events for meaningful analysis
 
     def _calculate_cross_entropy_statistics(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate comprehensive statistics for cross-entropy analysis."""
@@ -835,15 +1001,21 @@ class Aggregator:
             'parse_type_statistics': {}
         }
 
-        # Feature-level statistics
+        # Feature-level statistics; count the groups each feature occurs in with one
+        # pass over the groups rather than scanning every group per feature
+        newspapers_per_feature = Counter()
+        for data in analysis['by_newspaper'].values():
+            newspapers_per_feature.update(data['feature_counts'].keys())
+        parse_types_per_feature = Counter()
+        for data in analysis['by_parse_type'].values():
+            parse_types_per_feature.update(data['feature_counts'].keys())
+
         for feature_id, count in analysis['global']['feature_counts'].items():
             summary['feature_statistics'][feature_id] = {
                 'total_occurrences': count,
                 'percentage_of_total': (count / analysis['global']['total_events']) * 100,
-                'newspapers_found_in': len([n for n, data in analysis['by_newspaper'].items()
-                                          if feature_id in data['feature_counts']]),
-                'parse_types_found_in': len([p for p, data in analysis['by_parse_type'].items()
-                                           if feature_id in data['feature_counts']])
+                'newspapers_found_in': newspapers_per_feature[feature_id],
+                'parse_types_found_in': parse_types_per_feature[feature_id]
             }
 
         # Newspaper-level statistics
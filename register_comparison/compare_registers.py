@@ -283,8 +283,8 @@ print(f"Collected {len(sentence_ted_scores)} sentence-level TED scores")
 print("Global counts:", aggregator.global_counts())
 print("Counts per newspaper:", aggregator.per_newspaper_counts())
 
-# 5. Convert to matrix for DataFrame/CSV
-matrix = aggregator.to_matrix(aggregator.global_events)
+# 5. Convert to matrix for DataFrame/CSV (streamed; the rows are not kept around)
+matrix = aggregator.iter_matrix(aggregator.global_events)
 
 # output_creator.py: Save the output in terms of aggregated and pair-wise features
 
@@ -78,6 +78,24 @@ class MorphologicalRuleExtractor:
         with open(morph_analysis_path, 'r') as f:
             morph_data = json.load(f)
 
+        return self.extract_from_morphological_data(morph_data, min_confidence, min_frequency)
+
+    def extract_from_morphological_data(self,
+                                        morph_data: Dict[str, Any],
+                                        min_confidence: float = 0.70,
+                                        min_frequency: int = 10) -> List[MorphologicalRule]:
+        """
+        Extract morphological rules from already-loaded morphological analysis results.
+
+        Args:
+            morph_data: Parsed contents of morphological_analysis.json
+            min_confidence: Minimum confidence threshold
+            min_frequency: Minimum frequency threshold
+
+        Returns:
+            List of extracted morphological rules
+        """
+
         print(f"\n{'='*80}")
         print("EXTRACTING MORPHOLOGICAL RULES")
         print(f"{'='*80}")
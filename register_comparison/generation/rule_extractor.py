@@ -113,14 +113,31 @@ class RuleExtractor:
             Dictionary with extracted rules and statistics
         """
 
-        print(f"\n{'='*80}")
-        print("EXTRACTING TRANSFORMATION RULES")
-        print(f"{'='*80}")
-
         # Load analysis
         with open(analysis_path, 'r') as f:
             analysis = json.load(f)
 
+        return self.extract_from_data(analysis, min_confidence, min_frequency)
+
+    def extract_from_data(self, analysis: Dict[str, Any],
+                          min_confidence: float = 0.90,
+                          min_frequency: int = 5) -> Dict[str, Any]:
+        """
+        Extract rules from an already-loaded enhanced systematicity analysis.
+
+        Args:
+            analysis: Parsed contents of enhanced_analysis.json
+            min_confidence: Minimum consistency for rule extraction
+            min_frequency: Minimum instances for reliability
+
+        Returns:
+            Dictionary with extracted rules and statistics
+        """
+
+        print(f"\n{'='*80}")
+        print("EXTRACTING TRANSFORMATION RULES")
+        print(f"{'='*80}")
+
         # Extract lexical rules (best granularity)
         print("\n1. Extracting lexical rules...")
         self._extract_lexical_rules(
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Regression test for value-pair transformation types in the Aggregator.
+
+Value pairs are keyed by their "canonical→headline" string form, so events
+whose values differ only in type (1 vs '1') share a key and must be classified
+from that string form, whichever event comes first.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project to path
+project_root = Path(__file__).parent
+sys.path.append(str(project_root))
+
+from register_comparison.aggregators.aggregator import Aggregator
+from register_comparison.comparators.comparator import DifferenceEvent
+
+
+def create_mixed_type_events():
+    """Events mixing int and str values that format to the same pair keys."""
+    values = [(1, '1'), ('1', '1'), ('1', 1), (1, 'ABSENT'), ('ABSENT', 2), ('NOUN', 'VERB')]
+    return [
+        DifferenceEvent('Times-of-India', sent_id, 'dep', 'POS-CHG', canonical, headline,
+                        'POS change', 'PC', '', '')
+        for sent_id, (canonical, headline) in enumerate(values)
+    ]
+
+
+def test_transformation_types_with_mixed_value_types():
+    """Keys that read the same are classified the same, in either event order."""
+    print("Testing transformation types with mixed int/str values...")
+
+    expected = {
+        'deletions': {'1→ABSENT': 1},
+        'additions': {'ABSENT→2': 1},
+        'changes': {'NOUN→VERB': 1},
+        'null_changes': {'1→1': 3},
+    }
+
+    events = create_mixed_type_events()
+    for ordered in (events, events[::-1]):
+        aggregator = Aggregator()
+        aggregator.add_events(ordered)
+        analysis = aggregator.get_feature_value_analysis()
+        types = analysis['transformation_patterns']['transformation_types']
+
+        assert types == expected, f"Unexpected transformation types: {types}"
+        print(f"✓ {len(ordered)} events classified: {types}")
+
+    return True
+
+
+if __name__ == "__main__":
+    print("🧪 Aggregator Value-Pair Test")
+    print("=" * 50)
+
+    try:
+        test_transformation_types_with_mixed_value_types()
+        print("\n✅ All tests passed!")
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)